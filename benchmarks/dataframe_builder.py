@@ -0,0 +1,79 @@
+"""
+Compare DataframeBuilder.build_df (records) with the columnar build_table:
+
+    python benchmarks/dataframe_builder.py [number of observations]
+"""
+import sys
+import timeit
+
+from pyteamtv.dataframe_builder import DataframeBuilder
+from pyteamtv.infra.requester import Requester
+from pyteamtv.models.observation import Observation
+from pyteamtv.models.observation_log import ObservationLog
+from pyteamtv.models.sporting_event import SportingEvent
+
+from json_codec import make_observation_log
+
+
+class ResourceGroup:
+    _requester = Requester("https://fake-url", "token")
+
+    def get_teams(self):
+        return []
+
+    def get_persons(self):
+        return []
+
+
+def make_observation_logs(size: int, log_size: int = 1000) -> list:
+    observation_logs = []
+    for i in range(0, size, log_size):
+        sporting_event = SportingEvent(
+            None,
+            {
+                "type": "match",
+                "name": "Home - Away",
+                "sportingEventId": f"sporting-event-{i}",
+                "clocks": {},
+                "scheduledAt": "2022-01-01T10:00:00.000Z",
+                "homeTeamId": "home",
+                "awayTeamId": "away",
+                "lineUpId": "line-up",
+            },
+        )
+        observation_logs.append(
+            ObservationLog(
+                Observation,
+                None,
+                "GET",
+                "",
+                "U1",
+                sporting_event,
+                data=make_observation_log(min(log_size, size - i)),
+            )
+        )
+    return observation_logs
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    observation_logs = make_observation_logs(size)
+    builder = DataframeBuilder(ResourceGroup())
+    print(f"{size} observations")
+
+    for name, build in (
+        ("build_df", lambda: builder.build_df(observation_logs)),
+        ("build_df(workers=4)", lambda: builder.build_df(observation_logs, workers=4)),
+        ("build_table", lambda: builder.build_table(observation_logs)),
+        (
+            "build_table().to_pandas()",
+            lambda: builder.build_table(observation_logs).to_pandas(),
+        ),
+        ("build_polars_df", lambda: builder.build_polars_df(observation_logs)),
+    ):
+        took = min(timeit.repeat(build, number=1, repeat=3))
+        print(f"{name:>26}: {took * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Compare the JSON codecs decoding observation log sized payloads:
+
+    python benchmarks/json_codec.py [number of observations]
+"""
+import json
+import random
+import sys
+import timeit
+import uuid
+
+from pyteamtv.infra.json_codec import CODECS, get_codec
+
+
+CODES = ["SHOT", "PASS", "POSSESSION", "TURNOVER", "REBOUND", "SUBSTITUTION"]
+
+
+def make_observation_log(size: int) -> list:
+    observations = []
+    for i in range(size):
+        start_time = i * 2.5
+        observations.append(
+            {
+                "observationId": str(uuid.uuid4()),
+                "clockId": "U1",
+                "code": random.choice(CODES),
+                "startTime": start_time,
+                "triggerTime": start_time + 1.0,
+                "endTime": start_time + 2.0,
+                "description": "",
+                "attributes": {
+                    "personId": str(uuid.uuid4()),
+                    "teamId": str(uuid.uuid4()),
+                    "type": "SHOT",
+                    "result": random.choice(["GOAL", "MISS"]),
+                    "distance": random.random() * 10,
+                    "angle": random.random() * 180,
+                },
+            }
+        )
+    return observations
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    observation_log = make_observation_log(size)
+    content = json.dumps(observation_log).encode("utf-8")
+    print(f"{size} observations, {len(content) / 1024 / 1024:.1f}MB")
+
+    for name in CODECS:
+        try:
+            _, (loads, _) = get_codec(name)
+        except ImportError:
+            print(f"{name:>8}: not installed")
+            continue
+
+        number = 20
+        decode = timeit.timeit(lambda: loads(content), number=number) / number
+        print(f"{name:>8}: decode {decode * 1000:7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Measure the memory used by model objects built from an observation log:
+
+    python benchmarks/model_memory.py [number of observations]
+"""
+import gc
+import json
+import sys
+import tracemalloc
+
+from pyteamtv.infra.json_codec import loads
+from pyteamtv.models.observation import Observation
+
+from json_codec import make_observation_log
+
+
+def measure(content: bytes, keep_raw_attributes: bool) -> int:
+    Observation.keep_raw_attributes = keep_raw_attributes
+    try:
+        gc.collect()
+        tracemalloc.start()
+        observations = [Observation(None, data) for data in loads(content)]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        Observation.keep_raw_attributes = True
+
+    assert observations
+    return size
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    content = json.dumps(make_observation_log(size)).encode("utf-8")
+    print(f"{size} observations")
+
+    for keep_raw_attributes in (True, False):
+        total = measure(content, keep_raw_attributes)
+        print(
+            f"keep_raw_attributes={keep_raw_attributes!s:>5}: "
+            f"{total / 1024 / 1024:7.1f}MB  {total / size:6.0f} bytes/observation"
+        )
+
+
+if __name__ == "__main__":
+    main()
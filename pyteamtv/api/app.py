@@ -1,4 +1,12 @@
+from typing import Optional, Union
+
 from pyteamtv.infra.requester import Requester
+from pyteamtv.infra.cache import HttpCache
+from pyteamtv.infra.cache_backends import CacheBackend
+from pyteamtv.infra.identity_map import IdentityMap
+from pyteamtv.infra.rate_limiter import RateLimiter
+from pyteamtv.infra.retry import RetryPolicy, RetryStats
+from pyteamtv.infra.session import DEFAULT_POOL_MAXSIZE
 from pyteamtv.models.resource_group.factory import factory as resource_group_factory
 from .endpoint import API_ENDPOINT
 
@@ -7,16 +15,45 @@ from ..models.access_requester import AccessRequester
 
 
 class TeamTVApp(object):
-    def __init__(self, jwt_token, app_id: str, use_cache: bool = False):
+    def __init__(
+        self,
+        jwt_token,
+        app_id: str,
+        use_cache: Union[bool, str, CacheBackend, HttpCache] = False,
+        public_key: Optional[Union[str, bytes]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        identity_map: bool = False,
+    ):
         self.jwt_token = jwt_token
 
-        token = decode(jwt_token, app_id)
+        token = decode(jwt_token, app_id, public_key=public_key)
 
         self._requester = Requester(
-            f"{API_ENDPOINT}/api", jwt_token, use_cache=use_cache
+            f"{API_ENDPOINT}/api",
+            jwt_token,
+            use_cache=use_cache,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            pool_maxsize=pool_maxsize,
+            identity_map=IdentityMap() if identity_map else None,
         )
         self.__token = token
 
+    @property
+    def cache(self) -> Optional[HttpCache]:
+        """The HTTP cache, None when `use_cache` is off. See `cache.stats`."""
+        return self._requester.cache
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """
+        Retries done per endpoint, shared by all resource groups of this
+        client: `retry_stats.total` and `retry_stats.as_dict()`.
+        """
+        return self._requester.retry_stats
+
     def get_resource_group(self):
         """
         :rtype: :class:`pyteamtv.resource_group.team.Team`
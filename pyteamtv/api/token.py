@@ -1,18 +1,81 @@
-from typing import Optional
+import os
+import threading
+import time
+from typing import Optional, Union
 
 import jwt
 import requests
 
 
-TOKEN = requests.get("https://public-keys.teamtv.nl/app.teamtv.nl.pub").content
+PUBLIC_KEY_URL = os.environ.get(
+    "TEAMTV_PUBLIC_KEY_URL", "https://public-keys.teamtv.nl/app.teamtv.nl.pub"
+)
+
+# How long a fetched public key is trusted before it's fetched again
+PUBLIC_KEY_TTL = 24 * 60 * 60
 
 DEFAULT_LEEWAY = 15 * 60
 
 
-def decode(jwt_token: str, app_id: Optional[str] = None, verify: bool = True):
+_lock = threading.Lock()
+_public_key: Optional[bytes] = None
+_public_key_expires_at: float = 0.0
+
+
+def set_public_key(key: Union[str, bytes, None], ttl: Optional[float] = None):
+    """
+    Inject the public key used to verify tokens, e.g. in offline environments
+    or tests. Pass None to clear it so it's fetched again on next use.
+
+    Args:
+        key: PEM encoded public key
+        ttl: Seconds the key stays valid. Default: forever
+    """
+    global _public_key, _public_key_expires_at
+
+    if isinstance(key, str):
+        key = key.encode("ascii")
+
+    with _lock:
+        _public_key = key
+        _public_key_expires_at = time.time() + ttl if ttl is not None else float("inf")
+
+
+def get_public_key() -> bytes:
+    """
+    Return the TeamTV public key, fetched from PUBLIC_KEY_URL on first use.
+
+    The key is only cached in-process: a copy on disk could be replaced by
+    anyone who can write there, and would then be trusted to verify tokens.
+    """
+    global _public_key, _public_key_expires_at
+
+    with _lock:
+        if _public_key and time.time() < _public_key_expires_at:
+            return _public_key
+
+        response = requests.get(PUBLIC_KEY_URL, timeout=10)
+        response.raise_for_status()
+        key = response.content
+
+        _public_key = key
+        _public_key_expires_at = time.time() + PUBLIC_KEY_TTL
+        return key
+
+
+def decode(
+    jwt_token: str,
+    app_id: Optional[str] = None,
+    verify: bool = True,
+    public_key: Union[str, bytes, None] = None,
+):
     options = None
+    key = public_key
     if not verify:
         options = {"verify_signature": False}
+        key = key or ""
+    elif not key:
+        key = get_public_key()
 
     audience = None
     if app_id:
@@ -20,7 +83,7 @@ def decode(jwt_token: str, app_id: Optional[str] = None, verify: bool = True):
 
     return jwt.decode(
         jwt_token,
-        TOKEN,
+        key,
         algorithms="RS256",
         verify=verify,
         audience=audience,
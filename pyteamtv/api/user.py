@@ -1,6 +1,12 @@
-from typing import Optional
+from typing import Optional, Union
 
 from pyteamtv.infra.requester import Requester
+from pyteamtv.infra.cache import HttpCache
+from pyteamtv.infra.cache_backends import CacheBackend
+from pyteamtv.infra.identity_map import IdentityMap
+from pyteamtv.infra.rate_limiter import RateLimiter
+from pyteamtv.infra.retry import RetryPolicy, RetryStats
+from pyteamtv.infra.session import DEFAULT_POOL_MAXSIZE
 from pyteamtv.models.list import List
 from pyteamtv.models.membership import Membership
 from pyteamtv.models.membership_list import MembershipList
@@ -14,7 +20,15 @@ from ..models.resource_group.team import TeamResourceGroup
 
 
 class TeamTVUser(object):
-    def __init__(self, jwt_token, use_cache: bool = False):
+    def __init__(
+        self,
+        jwt_token,
+        use_cache: Union[bool, str, CacheBackend, HttpCache] = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        identity_map: bool = False,
+    ):
         self.jwt_token = jwt_token
 
         token = decode(
@@ -23,10 +37,29 @@ class TeamTVUser(object):
         )
 
         self._requester = Requester(
-            f"{API_ENDPOINT}/api", jwt_token, use_cache=use_cache
+            f"{API_ENDPOINT}/api",
+            jwt_token,
+            use_cache=use_cache,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            pool_maxsize=pool_maxsize,
+            identity_map=IdentityMap() if identity_map else None,
         )
         self.__token = token
 
+    @property
+    def cache(self) -> Optional[HttpCache]:
+        """The HTTP cache, None when `use_cache` is off. See `cache.stats`."""
+        return self._requester.cache
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """
+        Retries done per endpoint, shared by all resource groups of this
+        client: `retry_stats.total` and `retry_stats.as_dict()`.
+        """
+        return self._requester.retry_stats
+
     def get_access_requester(self) -> AccessRequester:
         print(self.__token)
 
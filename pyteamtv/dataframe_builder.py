@@ -1,6 +1,12 @@
+import json
 import math
 
-from typing import List, Optional
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pyarrow
 
 from pyteamtv.models.observation_log import ObservationLog
 from pyteamtv.models.person import Person
@@ -22,6 +28,61 @@ def pol2cart(angle: float, distance: float):
     return x, y
 
 
+def pol2cart_array(angle, distance):
+    """Vectorized `pol2cart` for NumPy arrays."""
+    import numpy as np
+
+    angle = np.where(angle > 90, angle - 360, angle) + 90
+
+    phi = (angle / 360) * 2 * np.pi
+    return distance * np.cos(phi), distance * np.sin(phi)
+
+
+def _import_pyarrow_numpy():
+    try:
+        import numpy
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "numpy and pyarrow are required for build_table(). "
+            "Install them with: pip install pyteamtv[columnar]"
+        )
+    return pyarrow, numpy
+
+
+OBSERVATION_COLUMNS = (
+    "sporting_event_id",
+    "sporting_event_name",
+    "sporting_event_scheduled_at",
+    "observation_id",
+    "clock_id",
+    "start_time",
+    "end_time",
+    "code",
+    "description",
+    "possession_id",
+)
+
+SKIP_ATTRIBUTES = frozenset(["teamId", "personId", "team", "person"])
+
+# Columns with few distinct values, stored as dictionary arrays
+# (Categorical in pandas)
+DICTIONARY_COLUMNS = frozenset(
+    [
+        "sporting_event_id",
+        "sporting_event_name",
+        "clock_id",
+        "code",
+        "team_id",
+        "team_name",
+        "team_ground",
+        "team_name_full",
+        "team_key",
+        "position",
+    ]
+)
+
+
 class DataframeBuilder:
     def __init__(self, resource_group: TeamResourceGroup):
         self.teams = {team.team_id: team for team in resource_group.get_teams()}
@@ -30,13 +91,59 @@ class DataframeBuilder:
         }
         self._requester = resource_group._requester
 
-    def build_df(self, observation_logs: List[ObservationLog]):
+    @classmethod
+    def _from_lookup_tables(
+        cls, teams: Dict[str, Team], persons: Dict[str, Person], requester
+    ) -> "DataframeBuilder":
+        builder = cls.__new__(cls)
+        builder.teams = teams
+        builder.persons = persons
+        builder._requester = requester
+        return builder
+
+    def build_df(
+        self, observation_logs: List[ObservationLog], workers: Optional[int] = None
+    ):
+        """
+        Build a pandas DataFrame of the observations.
+
+        With `workers`, the observation logs are split in shards that are built
+        by a pool of that many processes. The team and person lookup tables are
+        sent to each process once; logs that aren't fetched yet are fetched by
+        the processes. As with any process pool, call this from a
+        `if __name__ == "__main__":` block on platforms that spawn processes
+        (Windows, macOS).
+        """
         try:
             import pandas as pd
         except ImportError:
             raise Exception("You don't have pandas installed. Please install first")
 
-        return pd.DataFrame.from_records(self.build_records(observation_logs))
+        if not workers or workers <= 1:
+            return pd.DataFrame.from_records(self.build_records(observation_logs))
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        observation_logs = list(observation_logs)
+        if not observation_logs:
+            return pd.DataFrame()
+
+        # A few shards per worker, so a shard of large logs doesn't keep the
+        # other workers waiting
+        shard_size = math.ceil(len(observation_logs) / (workers * 4))
+        shards = [
+            observation_logs[i : i + shard_size]
+            for i in range(0, len(observation_logs), shard_size)
+        ]
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)),
+            initializer=_init_worker,
+            initargs=(self.teams, self.persons, self._requester),
+        ) as executor:
+            frames = list(executor.map(_build_df_shard, shards))
+
+        return pd.concat(frames, ignore_index=True, sort=False)
 
     def _build_person_data(self, attributes: dict, key_prefix: Optional[str] = None):
         in_key = "person"
@@ -99,7 +206,16 @@ class DataframeBuilder:
         if team_id in self.teams:
             team = self.teams[team_id]
         else:
-            if "team" in attributes:
+            identity_map = self._requester.identity_map
+            # Fetched before, e.g. by MatchSportingEvent.get_home_team
+            known_team = (
+                identity_map.get(self._requester._key_prefix, Team, team_id)
+                if identity_map
+                else None
+            )
+            if known_team is not None:
+                team = known_team
+            elif "team" in attributes:
                 # This can happen when a team is not shared, but the data is.
                 # For certain leagues the data is entered from the club account
                 # and send to the exchange. The teams entities are not shared
@@ -129,61 +245,68 @@ class DataframeBuilder:
             team_key=team.key,
         )
 
+    def _iter_observations(self, observation_log: ObservationLog, skip_attributes: set):
+        """
+        Yields (observation, possession_id, team, persons) for the observations
+        of a log, where `team` is the team data of the current possession and
+        `persons` the data of all persons referenced by the observation.
+
+        Attributes that are expanded into person data are added to
+        `skip_attributes`.
+        """
+        sporting_event = observation_log.sporting_event
+
+        team = dict()
+        possession_id = None
+        possession_idx = 0
+        has_start_possession = any(
+            observation.code == "START-POSSESSION" for observation in observation_log
+        )
+        for observation in observation_log:
+            if has_start_possession and observation.code == "POSSESSION":
+                # When dataset contains start-possession, ignore the possession observations
+                # TODO: this might break when livetagging and video tagging are combined
+                #       as only livetagging contains start-possession
+                continue
+
+            if observation.code in ("START-POSSESSION", "POSSESSION"):
+                team = self.get_team_data(sporting_event, observation.attributes)
+                persons = {}
+                possession_id = (
+                    f"{sporting_event.sporting_event_id}:{possession_idx:05d}"
+                )
+                possession_idx += 1
+            else:
+                persons = self._build_person_data(observation.attributes)
+                # Find all attributes ending with PersonId (capital P)
+                # Note: "personId" (lowercase p) won't match, so it's handled separately above
+                for key in observation.attributes.keys():
+                    if key.endswith("PersonId"):
+                        # Extract prefix (e.g., "opponent" from "opponentPersonId")
+                        prefix = key[:-8]  # Remove "PersonId"
+                        extra_person = self._build_person_data(
+                            observation.attributes, prefix
+                        )
+                        persons.update(extra_person)
+                        # Add these to skip_attributes dynamically
+                        skip_attributes.add(key)
+                        skip_attributes.add(f"{prefix}Person")
+
+            yield observation, possession_id, team, persons
+
     def build_records(self, observation_logs: List[ObservationLog]):
         observations = []
-        skip_attributes = {
-            "teamId",
-            "personId",
-            "team",
-            "person",
-        }
+        skip_attributes = set(SKIP_ATTRIBUTES)
 
         for observation_log in observation_logs:
             sporting_event = observation_log.sporting_event
 
-            team = dict()
-            possession_id = None
-            possession_idx = 0
-            has_start_possession = any(
-                observation.code == "START-POSSESSION"
-                for observation in observation_log
-            )
-            for observation in observation_log:
-                if has_start_possession and observation.code == "POSSESSION":
-                    # When dataset contains start-possession, ignore the possession observations
-                    # TODO: this might break when livetagging and video tagging are combined
-                    #       as only livetagging contains start-possession
-                    continue
-
-                if observation.code in ("START-POSSESSION", "POSSESSION"):
-                    team = self.get_team_data(sporting_event, observation.attributes)
-                    person = {}
-                    extra_persons = {}
-                    possession_id = (
-                        f"{sporting_event.sporting_event_id}:{possession_idx:05d}"
-                    )
-                    possession_idx += 1
-                else:
-                    person = self._build_person_data(observation.attributes)
-                    extra_persons = {}
-                    # Find all attributes ending with PersonId (capital P)
-                    # Note: "personId" (lowercase p) won't match, so it's handled separately above
-                    for key in observation.attributes.keys():
-                        if key.endswith("PersonId"):
-                            # Extract prefix (e.g., "opponent" from "opponentPersonId")
-                            prefix = key[:-8]  # Remove "PersonId"
-                            extra_person = self._build_person_data(
-                                observation.attributes, prefix
-                            )
-                            extra_persons.update(extra_person)
-                            # Add these to skip_attributes dynamically
-                            skip_attributes.add(key)
-                            skip_attributes.add(f"{prefix}Person")
-
+            for observation, possession_id, team, persons in self._iter_observations(
+                observation_log, skip_attributes
+            ):
                 attributes = dict(possession_id=possession_id)
                 attributes.update(team)
-                attributes.update(person)
-                attributes.update(extra_persons)
+                attributes.update(persons)
                 for k, v in observation.attributes.items():
                     if k not in skip_attributes:
                         attributes[k] = v
@@ -212,3 +335,309 @@ class DataframeBuilder:
                 observations.append(observation_dict)
 
         return observations
+
+    def build_table(self, observation_logs: List[ObservationLog]):
+        """
+        Columnar version of `build_records`: the same data as a pyarrow Table.
+
+        Values are appended to a buffer per column instead of building a dict
+        per observation, `x`/`y` are computed with NumPy for all rows at once
+        and low-cardinality string columns are dictionary encoded. Convert the
+        result with `polars.from_arrow(table)` or `table.to_pandas()`.
+        """
+        return self._build_table(observation_logs, set(SKIP_ATTRIBUTES))
+
+    def _build_table(
+        self, observation_logs: Iterable[ObservationLog], skip_attributes: set
+    ):
+        pa, np = _import_pyarrow_numpy()
+
+        columns = {name: [] for name in OBSERVATION_COLUMNS}
+        observation_id = columns["observation_id"].append
+        clock_id = columns["clock_id"].append
+        start_time = columns["start_time"].append
+        end_time = columns["end_time"].append
+        code = columns["code"].append
+        description = columns["description"].append
+        possession_ids = columns["possession_id"].append
+        team_data = []
+        teams = team_data.append
+
+        # Columns that depend on the data (persons, attributes): only the rows
+        # that have a value are stored, as (rows, values)
+        sparse_columns: Dict[str, tuple] = {}
+
+        row = 0
+        for observation_log in observation_logs:
+            sporting_event = observation_log.sporting_event
+            first_row = row
+
+            for observation, possession_id, team, persons in self._iter_observations(
+                observation_log, skip_attributes
+            ):
+                observation_id(observation.observation_id)
+                clock_id(observation.clock_id)
+                start_time(observation.start_time)
+                end_time(observation.end_time)
+                code(observation.code)
+                description(observation.description)
+                possession_ids(possession_id)
+
+                # The team data is the same for all observations of a possession
+                teams(team)
+
+                for items in (persons.items(), observation.attributes.items()):
+                    for k, v in items:
+                        if k in skip_attributes:
+                            continue
+                        column = sparse_columns.get(k)
+                        if column is None:
+                            column = sparse_columns[k] = ([], [])
+                        rows, values = column
+                        if rows and rows[-1] == row:
+                            values[-1] = v
+                        else:
+                            rows.append(row)
+                            values.append(v)
+                row += 1
+
+            count = row - first_row
+            columns["sporting_event_id"].extend(
+                [sporting_event.sporting_event_id] * count
+            )
+            columns["sporting_event_name"].extend([sporting_event.name] * count)
+            columns["sporting_event_scheduled_at"].extend(
+                [sporting_event.scheduled_at] * count
+            )
+
+        team_keys = {}
+        for team in {id(team): team for team in team_data}.values():
+            team_keys.update(dict.fromkeys(team))
+        for name in team_keys:
+            columns[name] = [team.get(name) for team in team_data]
+
+        for name, (rows, values) in sparse_columns.items():
+            if len(rows) == row:
+                columns[name] = values
+            else:
+                # Attributes override the team data (e.g. the position)
+                column = columns.get(name) or [None] * row
+                for i, value in zip(rows, values):
+                    column[i] = value
+                columns[name] = column
+
+        if "position" in columns:
+            columns["position"] = [
+                position.split(":")[0] if position else position
+                for position in columns["position"]
+            ]
+
+        arrays = {
+            name: _to_arrow_array(pa, name, values) for name, values in columns.items()
+        }
+
+        if "angle" in columns and "distance" in columns:
+            angle = np.array(columns["angle"], dtype=np.float64)
+            distance = np.array(columns["distance"], dtype=np.float64)
+            x, y = pol2cart_array(angle, distance)
+            # Rows without an angle or distance have NaN: store them as null
+            arrays["x"] = pa.array(x, from_pandas=True)
+            arrays["y"] = pa.array(y, from_pandas=True)
+
+        return pa.table(arrays)
+
+    def iter_batches(
+        self,
+        observation_logs: Iterable[ObservationLog],
+        batch_size: Optional[int] = None,
+    ) -> Iterator["pyarrow.RecordBatch"]:
+        """
+        Streaming version of `build_table`: yields pyarrow RecordBatches, one
+        per observation log or, with `batch_size`, of `batch_size` rows (the
+        last one can be smaller).
+
+        Only the current batch is kept in memory. Pass the observation logs
+        as a generator, so every log can be released once it's processed::
+
+            observation_logs = (
+                sporting_event.get_observation_log()
+                for sporting_event in team.get_sporting_events()
+            )
+            for batch in builder.iter_batches(observation_logs, batch_size=100_000):
+                ...
+
+        The columns of batches can differ, as the attributes differ between
+        observation logs.
+        """
+        pa, _ = _import_pyarrow_numpy()
+
+        skip_attributes = set(SKIP_ATTRIBUTES)
+        pending, pending_rows, schema = [], 0, None
+        for observation_log in observation_logs:
+            table = self._build_table([observation_log], skip_attributes)
+            if not table.num_rows:
+                continue
+            if batch_size is None:
+                yield from table.to_batches()
+                continue
+
+            pending.extend(table.to_batches())
+            pending_rows += table.num_rows
+            schema = _merge_schemas(pa, schema, table.schema)
+            if pending_rows < batch_size:
+                continue
+
+            combined = pa.Table.from_batches(
+                [_conform(pa, batch, schema) for batch in pending], schema
+            ).combine_chunks()
+            offset = 0
+            while pending_rows - offset >= batch_size:
+                yield combined.slice(offset, batch_size).to_batches()[0]
+                offset += batch_size
+            pending = combined.slice(offset).to_batches()
+            pending_rows -= offset
+
+        if pending_rows:
+            yield pa.Table.from_batches(
+                [_conform(pa, batch, schema) for batch in pending], schema
+            ).combine_chunks().to_batches()[0]
+
+    def write_parquet(
+        self,
+        observation_logs: Iterable[ObservationLog],
+        path: Union[str, os.PathLike],
+        batch_size: int = 100_000,
+    ) -> int:
+        """
+        Write the data of `build_table` to a Parquet file in batches of
+        `batch_size` rows, so any number of observation logs can be exported
+        in constant memory (see `iter_batches`). Returns the number of rows.
+
+        Columns that only show up in later batches are added to the file (null
+        for the earlier rows); that takes one extra pass over the written data.
+        """
+        pa, _ = _import_pyarrow_numpy()
+        import pyarrow.parquet as pq
+
+        path = Path(path)
+        parts = []
+        writer, schema, num_rows = None, None, 0
+        try:
+            for batch in self.iter_batches(observation_logs, batch_size):
+                merged = _merge_schemas(pa, schema, batch.schema)
+                if writer is not None and not merged.equals(schema):
+                    # A Parquet file has a fixed schema: continue in a new part
+                    writer.close()
+                    writer = None
+                schema = merged
+                if writer is None:
+                    parts.append(path.with_name(f"{path.name}.part{len(parts)}"))
+                    writer = pq.ParquetWriter(parts[-1], schema)
+                writer.write_batch(_conform(pa, batch, schema))
+                num_rows += batch.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if not parts:
+            pq.write_table(self.build_table([]), path)
+        elif len(parts) == 1:
+            os.replace(parts[0], path)
+        else:
+            tmp_path = path.with_name(f"{path.name}.tmp")
+            with pq.ParquetWriter(tmp_path, schema) as writer:
+                for part in parts:
+                    # Close the part before deleting it, an open file can't be
+                    # removed on Windows
+                    with pq.ParquetFile(part) as parquet_file:
+                        for batch in parquet_file.iter_batches(batch_size):
+                            writer.write_batch(_conform(pa, batch, schema))
+                    part.unlink()
+            os.replace(tmp_path, path)
+        return num_rows
+
+    def build_polars_df(self, observation_logs: List[ObservationLog]):
+        try:
+            import polars
+        except ImportError:
+            raise ImportError(
+                "polars is required for build_polars_df(). "
+                "Install it with: pip install polars"
+            )
+
+        return polars.from_arrow(self.build_table(observation_logs))
+
+
+# The DataframeBuilder of a build_df worker process
+_worker_builder: Optional[DataframeBuilder] = None
+
+
+def _init_worker(teams: Dict[str, Team], persons: Dict[str, Person], requester):
+    global _worker_builder
+    _worker_builder = DataframeBuilder._from_lookup_tables(teams, persons, requester)
+
+
+def _build_df_shard(observation_logs: List[ObservationLog]):
+    import pandas as pd
+
+    return pd.DataFrame.from_records(_worker_builder.build_records(observation_logs))
+
+
+def _merge_schemas(pa, schema, other):
+    """Union of the fields of both schemas, conflicting types become strings."""
+    if schema is None:
+        return other
+
+    fields = {field.name: field for field in schema}
+    for field in other:
+        current = fields.get(field.name)
+        if current is None:
+            fields[field.name] = field
+        elif not current.type.equals(field.type):
+            try:
+                fields[field.name] = pa.unify_schemas(
+                    [pa.schema([current]), pa.schema([field])],
+                    promote_options="permissive",
+                ).field(0)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                fields[field.name] = pa.field(field.name, pa.string())
+    return pa.schema(list(fields.values()))
+
+
+def _conform(pa, batch, schema):
+    """`batch` with the columns and types of `schema`, missing columns are null."""
+    arrays = []
+    for field in schema:
+        index = batch.schema.get_field_index(field.name)
+        if index == -1:
+            arrays.append(pa.nulls(batch.num_rows, field.type))
+        else:
+            array = batch.column(index)
+            if not array.type.equals(field.type):
+                if pa.types.is_string(field.type) and pa.types.is_nested(array.type):
+                    # Arrow can't cast structs/lists to strings
+                    array = _to_json_strings(pa, array.to_pylist())
+                else:
+                    array = array.cast(field.type)
+            arrays.append(array)
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _to_json_strings(pa, values: list):
+    """Strings as they are, other values as JSON, like ObservationStore does."""
+    return pa.array(
+        [v if v is None or isinstance(v, str) else json.dumps(v) for v in values],
+        pa.string(),
+    )
+
+
+def _to_arrow_array(pa, name: str, values: list):
+    try:
+        array = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Attributes with values of mixed types, e.g. numbers and strings
+        array = _to_json_strings(pa, values)
+
+    if name in DICTIONARY_COLUMNS and pa.types.is_string(array.type):
+        array = array.dictionary_encode()
+    return array
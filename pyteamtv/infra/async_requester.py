@@ -0,0 +1,191 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+import requests
+
+from . import json_codec
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy, RetryStats, DEFAULT_RETRY_POLICY
+
+logger = logging.getLogger(__name__)
+
+
+def _to_requests_response(response, content: bytes) -> requests.Response:
+    """
+    A requests.Response for an aiohttp response, so HTTPErrors raised by the
+    async API have `e.response.status_code` like the ones of the sync API.
+    """
+    requests_response = requests.Response()
+    requests_response.status_code = response.status
+    requests_response.reason = response.reason
+    requests_response.headers.update(response.headers)
+    requests_response.url = str(response.url)
+    requests_response.encoding = response.get_encoding()
+    requests_response._content = content
+    return requests_response
+
+
+class AsyncRequester(object):
+    """asyncio counterpart of :class:`pyteamtv.infra.requester.Requester`.
+
+    Requires ``aiohttp`` (``pip install pyteamtv[async]``). All requesters
+    derived via `with_extra_headers` share the same ``aiohttp.ClientSession``
+    and the same concurrency limit, so the limit applies to the whole tree.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        jwt_token,
+        headers: dict = None,
+        timeout: Optional[int] = 30,
+        max_concurrency: int = 20,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_stats: Optional[RetryStats] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        _root: Optional["AsyncRequester"] = None,
+    ):
+        self._base_url = base_url
+        self.jwt_token = jwt_token
+        self.headers = dict(**headers) if headers else {}
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self.retry_stats = retry_stats or RetryStats()
+        # Only the requests per second limit is used here, concurrency is
+        # limited by max_concurrency.
+        self.rate_limiter = rate_limiter
+
+        self._root = _root or self
+        self._session = None
+        self._semaphore = None
+
+    @staticmethod
+    def _import_aiohttp():
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "aiohttp is required for AsyncRequester. "
+                "Install it with: pip install pyteamtv[async]"
+            )
+        return aiohttp
+
+    @property
+    def session(self):
+        root = self._root
+        if root._session is None:
+            aiohttp = self._import_aiohttp()
+            root._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return root._session
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the running event loop
+        root = self._root
+        if root._semaphore is None:
+            root._semaphore = asyncio.Semaphore(root.max_concurrency)
+        return root._semaphore
+
+    async def request(self, method, url, input_=None):
+        import pyteamtv
+
+        headers = dict(**self.headers)
+        headers["Authorization"] = f"Bearer {self.jwt_token}"
+        headers["User-Agent"] = f"pyteamtv {pyteamtv.__version__}"
+
+        aiohttp = self._import_aiohttp()
+
+        body = None
+        if input_ is not None:
+            body = json_codec.dumps(input_)
+            headers["Content-Type"] = "application/json"
+
+        start = time.time()
+        attempt = 0
+        while True:
+            async with self.semaphore:
+                if self.rate_limiter:
+                    delay = self.rate_limiter.reserve()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                logger.debug(f"Sending async {method} request to {url}")
+
+                try:
+                    async with self.session.request(
+                        method,
+                        self._base_url + url,
+                        headers=headers,
+                        data=body,
+                    ) as response:
+                        delay = self.retry_policy.get_retry_delay(
+                            method,
+                            attempt,
+                            time.time() - start,
+                            status_code=response.status,
+                            retry_after=response.headers.get("Retry-After"),
+                        )
+                        if delay is None:
+                            took = time.time() - start
+                            logger.debug(f"Request took: {took * 1000:.2f}ms")
+                            return await self._handle_response(
+                                response, method, url, input_
+                            )
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    delay = self.retry_policy.get_retry_delay(
+                        method, attempt, time.time() - start
+                    )
+                    if delay is None:
+                        raise
+
+            logger.warning(f"{method} {url} failed. Retrying in {delay:.2f}s")
+            self.retry_stats.increment(method, url)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _handle_response(self, response, method, url, input_):
+        if response.status >= 400:
+            content = await response.read()
+            error_msg = (
+                f"HTTP {response.status} Error: {response.reason}\n"
+                f"Request: {method} {self._base_url + url}\n"
+                f"Request Body: {input_}\n"
+                f"Response Content: {content.decode('utf-8', 'replace')}"
+            )
+            raise requests.HTTPError(
+                error_msg, response=_to_requests_response(response, content)
+            )
+
+        return json_codec.loads(await response.read())
+
+    def with_extra_headers(self, headers: dict):
+        new_headers = dict(**self.headers)
+        new_headers.update(headers)
+        return self.__class__(
+            self._base_url,
+            jwt_token=self.jwt_token,
+            headers=new_headers,
+            timeout=self.timeout,
+            max_concurrency=self.max_concurrency,
+            retry_policy=self.retry_policy,
+            retry_stats=self.retry_stats,
+            rate_limiter=self.rate_limiter,
+            _root=self._root,
+        )
+
+    async def close(self):
+        root = self._root
+        if root._session is not None:
+            await root._session.close()
+            root._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
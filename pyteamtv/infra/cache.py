@@ -0,0 +1,162 @@
+import fnmatch
+import hashlib
+import time
+from dataclasses import replace
+from typing import Optional, Dict, Union
+
+from .cache_backends import (
+    CacheBackend,
+    CacheEntry,
+    CacheStats,
+    MemoryBackend,
+    SQLiteBackend,
+    key_collection,
+)
+from ..exceptions import InputError
+
+
+# Seconds a response is used without revalidating it with the server. The
+# first matching pattern wins.
+DEFAULT_TTLS = {
+    "/sportingEvents/*/observations/*": 5,
+    "/persons*": 60 * 60,
+    "/teams*": 60 * 60,
+    "/users/me/*": 60 * 60,
+}
+
+DEFAULT_TTL = 60
+
+
+def make_key_prefix(base_url: str, jwt_token: str, headers: dict) -> str:
+    """
+    Prefix of the keys of the requests done by a requester: responses depend
+    on the host, the token and the resource group header. The full key is
+    the prefix followed by the url.
+    """
+    token_hash = hashlib.md5(jwt_token.encode("ascii")).hexdigest()
+    extra = ",".join(
+        f"{k}={v}"
+        for k, v in sorted(headers.items())
+        if k.lower() not in ("authorization", "user-agent")
+    )
+    return f"{base_url}|{token_hash}|{extra}|"
+
+
+class HttpCache(object):
+    """
+    Cache for GET responses, following HTTP semantics:
+
+    - A response is used as-is until its TTL expires. The TTL is picked per
+      endpoint from `ttls` (fnmatch patterns on the path), or `default_ttl`.
+    - Expired responses with an ETag or Last-Modified header are revalidated
+      with a conditional request, so an unchanged resource costs a 304
+      instead of a full transfer.
+    - A successful POST/PUT/PATCH/DELETE invalidates the cached responses of
+      the collection it touches, e.g. a POST to /teams/<id>/players
+      invalidates everything under /teams.
+    - Responses with ``Cache-Control: no-store`` are never stored,
+      ``no-cache`` responses are always revalidated.
+
+    Entries are kept in a `CacheBackend`, by default a size bounded in-memory LRU.
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = DEFAULT_TTL,
+        ttls: Optional[Dict[str, float]] = None,
+        backend: Optional[CacheBackend] = None,
+    ):
+        self.default_ttl = default_ttl
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.backend = backend if backend is not None else MemoryBackend()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.backend.stats
+
+    def get_ttl(self, url: str) -> float:
+        path = url.split("?", 1)[0]
+        for pattern, ttl in self.ttls.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self.backend.get(key)
+        if entry is None:
+            self.stats.increment("misses")
+        elif entry.is_fresh:
+            self.stats.increment("hits")
+        return entry
+
+    def store(self, key: str, url: str, response) -> Optional[CacheEntry]:
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return None
+
+        ttl = 0 if "no-cache" in cache_control else self.get_ttl(url)
+        entry = CacheEntry(
+            content=response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            expires_at=time.time() + ttl,
+        )
+        if ttl <= 0 and not entry.can_revalidate:
+            return None
+
+        self.backend.set(key, entry)
+        return entry
+
+    def refresh(self, key: str, url: str, entry: CacheEntry, response) -> CacheEntry:
+        """The server confirmed (304) the entry is still valid."""
+        self.stats.increment("revalidations")
+        entry = replace(
+            entry,
+            etag=response.headers.get("ETag") or entry.etag,
+            expires_at=time.time() + self.get_ttl(url),
+        )
+        self.backend.set(key, entry)
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry: CacheEntry) -> dict:
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def invalidate(self, url: str):
+        """Drop all entries of the collection `url` belongs to."""
+        self.backend.delete_collection(key_collection(url))
+
+    def clear(self):
+        self.backend.clear()
+
+
+def create_cache(
+    use_cache: Union[bool, str, CacheBackend, HttpCache]
+) -> Optional[HttpCache]:
+    """
+    Create the HttpCache for a `use_cache` option:
+
+    - False: no cache
+    - True or "memory": in-memory LRU cache
+    - "sqlite": on-disk cache in TEAMTV_CACHE_DIR (default: the per-user
+      cache directory, see `get_cache_dir`)
+    - a CacheBackend: HttpCache using that backend
+    - an HttpCache: used as-is
+    """
+    if not use_cache:
+        return None
+    if isinstance(use_cache, HttpCache):
+        return use_cache
+    if isinstance(use_cache, CacheBackend):
+        return HttpCache(backend=use_cache)
+    if use_cache is True or use_cache == "memory":
+        return HttpCache(backend=MemoryBackend())
+    if use_cache == "sqlite":
+        return HttpCache(backend=SQLiteBackend())
+
+    raise InputError(f"Unknown use_cache option: {use_cache!r}")
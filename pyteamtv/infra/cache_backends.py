@@ -0,0 +1,365 @@
+import os
+import sqlite3
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Iterable, Dict
+
+
+def _user_cache_dir() -> str:
+    try:
+        import platformdirs
+    except ImportError:
+        if sys.platform == "win32":
+            base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        elif sys.platform == "darwin":
+            base = os.path.expanduser("~/Library/Caches")
+        else:
+            base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        return os.path.join(base, "pyteamtv")
+
+    return platformdirs.user_cache_dir("pyteamtv", appauthor=False)
+
+
+def get_cache_dir() -> Path:
+    """
+    Directory where pyteamtv stores its on-disk caches: TEAMTV_CACHE_DIR or
+    the per-user cache directory. Cached responses are only readable by the
+    current user, so the directory is created with mode 0700 and refused
+    when it's owned by somebody else.
+    """
+    cache_dir = Path(os.environ.get("TEAMTV_CACHE_DIR") or _user_cache_dir())
+    cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    if hasattr(os, "getuid"):
+        stat = cache_dir.stat()
+        if stat.st_uid != os.getuid():
+            raise PermissionError(
+                f"Cache directory {cache_dir} is owned by another user"
+            )
+        if stat.st_mode & 0o077:
+            os.chmod(cache_dir, 0o700)
+    return cache_dir
+
+
+def key_collection(key: str) -> str:
+    """
+    Collection of a cache key (`<prefix>|<path>`): the first segment of the
+    path, e.g. "/teams" for ".../teams/<id>/players?x=1".
+    """
+    path = key.rsplit("|", 1)[-1]
+    return "/" + path.lstrip("/").split("/", 1)[0].split("?", 1)[0]
+
+
+@dataclass
+class CacheEntry:
+    content: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def can_revalidate(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+
+class CacheStats(object):
+    """Thread-safe hit/miss/revalidation/eviction counters."""
+
+    FIELDS = ("hits", "misses", "revalidations", "evictions")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def increment(self, field: str, value: int = 1):
+        with self._lock:
+            self._counts[field] += value
+
+    def __getattr__(self, name):
+        if name in CacheStats.FIELDS:
+            return self._counts[name]
+        raise AttributeError(name)
+
+    def as_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self):
+        with self._lock:
+            self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def __getstate__(self):
+        return self.as_dict()
+
+    def __setstate__(self, state):
+        self._lock = threading.Lock()
+        self._counts = dict(state)
+
+    def __repr__(self):
+        return f"<CacheStats {self.as_dict()}>"
+
+
+class CacheBackend(ABC):
+    """
+    Storage of an HttpCache. Implementations must be thread-safe.
+
+    To use a shared network store (Redis, memcached, ...) subclass this and
+    implement `get`, `set`, `delete`, `keys` and `clear`. Count evictions done
+    by the backend itself in `self.stats`.
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry):
+        pass
+
+    @abstractmethod
+    def delete(self, key: str):
+        pass
+
+    @abstractmethod
+    def keys(self) -> Iterable[str]:
+        pass
+
+    def delete_collection(self, collection: str):
+        """
+        Delete all keys of a collection (see `key_collection`). Override this
+        when the store can do it without listing all keys.
+        """
+        for key in self.keys():
+            if key_collection(key) == collection:
+                self.delete(key)
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+
+class MemoryBackend(CacheBackend):
+    """In-process LRU cache bounded by the total size of the stored responses."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        super().__init__()
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._collections: Dict[str, set] = defaultdict(set)
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old.size
+
+            self._entries[key] = entry
+            self._collections[key_collection(key)].add(key)
+            self._size += entry.size
+
+            while self._size > self.max_bytes:
+                evicted_key = next(iter(self._entries))
+                self._delete(evicted_key)
+                self.stats.increment("evictions")
+
+    def _delete(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+            collection = key_collection(key)
+            keys = self._collections[collection]
+            keys.discard(key)
+            if not keys:
+                del self._collections[collection]
+
+    def delete(self, key: str):
+        with self._lock:
+            self._delete(key)
+
+    def delete_collection(self, collection: str):
+        with self._lock:
+            for key in list(self._collections.get(collection, ())):
+                self._delete(key)
+
+    def keys(self) -> Iterable[str]:
+        with self._lock:
+            return list(self._entries.keys())
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._collections.clear()
+            self._size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        # Cached responses are not worth storing in a (Flask/Streamlit) session
+        return dict(max_bytes=self.max_bytes)
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    On-disk LRU cache in a SQLite database, bounded by the total size of the
+    stored responses. Can be shared by multiple processes on the same machine.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_bytes: int = 256 * 1024 * 1024):
+        super().__init__()
+        self.path = str(path or get_cache_dir() / "http_cache.sqlite")
+        self.max_bytes = max_bytes
+
+        Path(self.path).parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        # SQLite creates its -wal/-shm files with the permissions of the database
+        os.chmod(self.path, 0o600)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+
+        columns = [
+            row[1] for row in self._connection.execute("PRAGMA table_info(entries)")
+        ]
+        if columns and "collection" not in columns:
+            # Database of an older version: it's a cache, start over
+            self._connection.execute("DROP TABLE entries")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                collection TEXT NOT NULL,
+                content BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                expires_at REAL NOT NULL,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_collection ON entries (collection)"
+        )
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content, etag, last_modified, expires_at FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._connection.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        return CacheEntry(*row)
+
+    def set(self, key: str, entry: CacheEntry):
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    key_collection(key),
+                    entry.content,
+                    entry.etag,
+                    entry.last_modified,
+                    entry.expires_at,
+                    entry.size,
+                    time.time(),
+                ),
+            )
+            self._evict()
+
+    def _evict(self):
+        (total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at"
+        ).fetchall():
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            evicted += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+        self.stats.increment("evictions", evicted)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def keys(self) -> Iterable[str]:
+        with self._lock:
+            return [
+                key for (key,) in self._connection.execute("SELECT key FROM entries")
+            ]
+
+    def delete_collection(self, collection: str):
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM entries WHERE collection = ?", (collection,)
+            )
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __getstate__(self):
+        return dict(path=self.path, max_bytes=self.max_bytes)
+
+    def __setstate__(self, state):
+        self.__init__(**state)
@@ -0,0 +1,75 @@
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class IdentityMap(object):
+    """
+    Per-session map of model objects keyed by (type, id), so an entity that
+    is fetched repeatedly (a team, the original of a sporting event, ...) is
+    represented by one object and is only requested once.
+
+    Enable it with `TeamTVUser(token, identity_map=True)`. It is shared by
+    all requesters derived from that user/app and it's thread-safe. Objects
+    are also keyed by `scope`, the requester's key prefix (host, token and
+    resource group), so a resource group never gets an object fetched by,
+    and holding the requester and privileges of, another resource group.
+
+    Objects are kept until they are invalidated: call `invalidate` or `clear`
+    to drop them, or pass `refresh=True` to a getter to re-fetch an object and
+    update the existing instance in place.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._objects: Dict[Tuple[str, type, str], Any] = {}
+
+    def get(self, scope: str, type_: type, id_: str) -> Optional[Any]:
+        with self._lock:
+            return self._objects.get((scope, type_, id_))
+
+    def get_or_create(
+        self, scope: str, type_: type, id_: str, create: Callable[[], T]
+    ) -> T:
+        """
+        Return the object for (scope, type_, id_), calling `create` when there
+        is none yet. `create` runs without holding the lock, when two threads
+        race the first object stored wins.
+        """
+        key = (scope, type_, id_)
+        with self._lock:
+            obj = self._objects.get(key)
+        if obj is not None:
+            return obj
+
+        obj = create()
+        with self._lock:
+            return self._objects.setdefault(key, obj)
+
+    def invalidate(self, type_: Optional[type] = None, id_: Optional[str] = None):
+        """Drop one object (in all scopes), all objects of a type, or everything."""
+        with self._lock:
+            if type_ is None:
+                self._objects.clear()
+                return
+            for key in [
+                key
+                for key in self._objects
+                if key[1] is type_ and (id_ is None or key[2] == id_)
+            ]:
+                del self._objects[key]
+
+    def clear(self):
+        self.invalidate()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __getstate__(self):
+        # Like cached responses, objects are not worth storing in a
+        # (Flask/Streamlit) session
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
@@ -0,0 +1,92 @@
+"""
+JSON encoding/decoding of request and response bodies.
+
+orjson or msgspec are used to decode responses when installed
+(`pip install pyteamtv[speedups]`), they are several times faster than the
+stdlib `json` module on large observation logs. Set TEAMTV_JSON_CODEC to
+"orjson", "msgspec" or "json" to pick one explicitly. Request bodies are always
+encoded with the `json` module.
+"""
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Tuple
+
+from ..exceptions import InputError
+
+logger = logging.getLogger(__name__)
+
+
+Codec = Tuple[Callable[[bytes], Any], Callable[[Any], bytes]]
+
+
+def _dumps(obj) -> bytes:
+    # Same settings requests uses for `json=`. Also used with orjson/msgspec:
+    # those write NaN and Infinity as null instead of raising, and request
+    # bodies are small, so there's little to gain from a faster encoder.
+    return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+
+def _stdlib_codec() -> Codec:
+    return json.loads, _dumps
+
+
+def _orjson_codec() -> Codec:
+    import orjson
+
+    return orjson.loads, _dumps
+
+
+def _msgspec_codec() -> Codec:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+
+    def loads(content: bytes) -> Any:
+        try:
+            return decoder.decode(content)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return loads, _dumps
+
+
+CODECS: Dict[str, Callable[[], Codec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+def get_codec(name: str = None) -> Tuple[str, Codec]:
+    """
+    Get a codec by name, or the fastest one installed when `name` is None.
+    Returns the name and a `(loads, dumps)` tuple.
+    """
+    if name is not None:
+        if name not in CODECS:
+            raise InputError(
+                f"Unknown JSON codec: {name!r}. Choose from {', '.join(CODECS)}"
+            )
+        return name, CODECS[name]()
+
+    for name, factory in CODECS.items():
+        try:
+            return name, factory()
+        except ImportError:
+            continue
+
+
+def _codec_from_env() -> Tuple[str, Codec]:
+    name = os.environ.get("TEAMTV_JSON_CODEC")
+    try:
+        return get_codec(name)
+    except (InputError, ImportError) as e:
+        # A typo in the environment shouldn't make `import pyteamtv` fail
+        logger.warning(
+            f"Can't use TEAMTV_JSON_CODEC={name!r} ({e}), using the json module"
+        )
+        return get_codec("json")
+
+
+CODEC_NAME, (loads, dumps) = _codec_from_env()
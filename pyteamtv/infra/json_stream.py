@@ -0,0 +1,97 @@
+import codecs
+import json
+from typing import Iterable, Iterator, Any
+
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+_decoder = json.JSONDecoder()
+
+
+class _Buffer(object):
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def read_more(self) -> bool:
+        """Append the next chunk to the buffer. Returns False at end of input."""
+        if self.exhausted:
+            return False
+
+        # Drop what is already parsed, so memory stays bounded by the item size
+        self.text = self.text[self.pos :]
+        self.pos = 0
+
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                self.text += text
+                return True
+
+        self.text += self._utf8.decode(b"", final=True)
+        self.exhausted = True
+        return False
+
+    def skip_whitespace(self):
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text) or not self.read_more():
+                return
+
+    def peek(self) -> str:
+        self.skip_whitespace()
+        if self.pos >= len(self.text):
+            raise json.JSONDecodeError("Unexpected end of input", self.text, self.pos)
+        return self.text[self.pos]
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Incrementally parse a JSON array from an iterable of byte chunks (for
+    example ``response.iter_content()``) and yield its items one by one.
+
+    Only one item (plus one chunk) is held in memory at a time.
+    """
+    buffer = _Buffer(chunks)
+
+    if buffer.peek() != "[":
+        raise json.JSONDecodeError("Expected '['", buffer.text, buffer.pos)
+    buffer.pos += 1
+
+    if buffer.peek() == "]":
+        return
+
+    while True:
+        buffer.skip_whitespace()
+        while True:
+            try:
+                item, end = _decoder.raw_decode(buffer.text, buffer.pos)
+            except json.JSONDecodeError:
+                if not buffer.read_more():
+                    raise
+                continue
+
+            # A value not followed by a delimiter might be truncated (e.g. the
+            # number 12 of 123, or 1.5 of 1.5e3), so retry with more input.
+            if (
+                end == len(buffer.text) or buffer.text[end] not in _DELIMITERS
+            ) and buffer.read_more():
+                continue
+            break
+
+        buffer.pos = end
+        yield item
+
+        separator = buffer.peek()
+        buffer.pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise json.JSONDecodeError(
+                "Expected ',' or ']'", buffer.text, buffer.pos - 1
+            )
@@ -0,0 +1,105 @@
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter(object):
+    """
+    Client side rate limiter: a token bucket for requests per second combined
+    with a cap on the number of requests in flight.
+
+    One instance is shared by all requesters derived from the same
+    TeamTVUser/TeamTVApp, and it's thread-safe, so the limits hold for the
+    process as a whole no matter how many resource groups or threads are used::
+
+        limiter = RateLimiter(requests_per_second=10, max_in_flight=8)
+        user = TeamTVUser(token, rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        """
+        Args:
+            requests_per_second: Sustained request rate. None means unlimited
+            burst: Number of requests allowed at once after being idle.
+                   Default: requests_per_second rounded up
+            max_in_flight: Maximum number of concurrent requests. None means unlimited
+        """
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+
+        self.requests_per_second = requests_per_second
+        self.burst = burst or (
+            max(1, int(requests_per_second + 0.999)) if requests_per_second else 1
+        )
+        self.max_in_flight = max_in_flight
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._in_flight = (
+            threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        )
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket and return the number of seconds the
+        caller must wait before sending its request. Doesn't block, so it can
+        be used from asyncio code too.
+        """
+        if self.requests_per_second is None:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._last_refill) * self.requests_per_second,
+            )
+            self._last_refill = now
+
+            # Tokens may go negative: callers queue up behind each other
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.requests_per_second
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        if self._in_flight:
+            self._in_flight.acquire()
+
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def release(self):
+        if self._in_flight:
+            self._in_flight.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    def __getstate__(self):
+        return dict(
+            requests_per_second=self.requests_per_second,
+            burst=self.burst,
+            max_in_flight=self.max_in_flight,
+        )
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __repr__(self):
+        return (
+            f"<RateLimiter requests_per_second={self.requests_per_second} "
+            f"burst={self.burst} max_in_flight={self.max_in_flight}>"
+        )
@@ -1,78 +1,247 @@
 import time
-from copy import copy
-from typing import Optional
+from contextlib import nullcontext
+from typing import Any, NamedTuple, Optional, Union
 
 import requests
 import logging
 
+from . import json_codec
+from .cache import HttpCache, create_cache, make_key_prefix
+from .cache_backends import CacheBackend
+from .identity_map import IdentityMap
+from .json_stream import iter_json_array
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy, RetryStats, DEFAULT_RETRY_POLICY
+from .session import DEFAULT_POOL_MAXSIZE, SessionPool
+from .single_flight import SINGLE_FLIGHT
+
 
 logger = logging.getLogger(__name__)
 
 
+class ConditionalResponse(NamedTuple):
+    """Result of `Requester.request_conditional`; `data` is None when unchanged."""
+
+    data: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    @property
+    def not_modified(self) -> bool:
+        return self.data is None
+
+
 class Requester(object):
     def __init__(
         self,
         base_url,
         jwt_token,
         headers: dict = None,
-        use_cache: bool = False,
+        use_cache: Union[bool, str, CacheBackend, HttpCache] = False,
         timeout: Optional[int] = 30,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_stats: Optional[RetryStats] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        session_pool: Optional[SessionPool] = None,
+        cache: Optional[HttpCache] = None,
+        coalesce_requests: bool = True,
+        identity_map: Optional[IdentityMap] = None,
     ):
         self._base_url = base_url
         self.jwt_token = jwt_token
         self.headers = dict(**headers) if headers else {}
         self.use_cache = use_cache
+        self._request_headers = self._build_request_headers()
+        self._key_prefix = make_key_prefix(base_url, jwt_token, self.headers)
         self.timeout = timeout
-        self._session = None
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        # Shared with all derived requesters
+        self.retry_stats = retry_stats or RetryStats()
+        self.rate_limiter = rate_limiter
+
+        if not session_pool:
+            session_pool = SessionPool(pool_maxsize=pool_maxsize, keep_alive=keep_alive)
+        # Shared with all derived requesters
+        self.session_pool = session_pool
+
+        if cache is None:
+            cache = create_cache(use_cache)
+        # Shared with all derived requesters
+        self.cache = cache
+
+        # When True, identical GET requests running at the same time (from
+        # different threads) share one HTTP request. Every caller decodes the
+        # response body itself, so callers never share result objects.
+        self.coalesce_requests = coalesce_requests
+
+        # Shared with all derived requesters. None when disabled
+        self.identity_map = identity_map
+
+    def _build_request_headers(self) -> dict:
+        import pyteamtv
+
+        # Built once and never mutated afterwards, so it can be shared by all
+        # threads using this requester
+        headers = dict(**self.headers)
+        headers["Authorization"] = f"Bearer {self.jwt_token}"
+        headers["User-Agent"] = f"pyteamtv {pyteamtv.__version__}"
+        return headers
 
     @property
     def session(self):
-        if not getattr(self, "_session", None):
-            if self.use_cache:
-                import requests_cache
-                import hashlib
-                from datetime import timedelta
-
-                self._session = requests_cache.CachedSession(
-                    hashlib.md5(self.jwt_token.encode("ascii")).hexdigest(),
-                    expire_after=timedelta(days=1),
+        return self.session_pool.session
+
+    def close(self):
+        """Close the connections of this requester and all requesters derived from it."""
+        self.session_pool.close()
+
+    def _send(self, method, url, headers, input_, stream=False):
+        """Send the request, retrying transient failures according to the retry policy."""
+        body = None
+        if input_ is not None:
+            # Encoded once, outside the retry loop, with the fastest codec installed
+            body = json_codec.dumps(input_)
+            headers = {**headers, "Content-Type": "application/json"}
+
+        start = time.time()
+        attempt = 0
+        while True:
+            try:
+                with self.rate_limiter or nullcontext():
+                    response = self.session.request(
+                        method,
+                        self._base_url + url,
+                        headers=headers,
+                        data=body,
+                        timeout=self.timeout,
+                        stream=stream,
+                    )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self.retry_policy.get_retry_delay(
+                    method, attempt, time.time() - start
+                )
+                if delay is None:
+                    raise
+                logger.warning(
+                    f"{method} {url} failed with {e.__class__.__name__}. "
+                    f"Retrying in {delay:.2f}s"
                 )
             else:
-                self._session = requests.Session()
-
-        return self._session
+                delay = self.retry_policy.get_retry_delay(
+                    method,
+                    attempt,
+                    time.time() - start,
+                    status_code=response.status_code,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                logger.warning(
+                    f"{method} {url} returned {response.status_code}. "
+                    f"Retrying in {delay:.2f}s"
+                )
+                # Release the connection of a streamed response we won't read
+                response.close()
 
-    def __getstate__(self):
-        d = copy(self.__dict__)
-        if "_session" in d:
-            del d["_session"]
-        return d
+            self.retry_stats.increment(method, url)
+            time.sleep(delay)
+            attempt += 1
 
     def request(self, method, url, input_=None):
-        import pyteamtv
+        if method == "GET" and self.coalesce_requests:
+            content = SINGLE_FLIGHT.do(
+                self._key_prefix + url, lambda: self._request(method, url, input_)
+            )
+        else:
+            content = self._request(method, url, input_)
+        return json_codec.loads(content)
 
+    def _request(self, method, url, input_=None) -> bytes:
+        """Do the request (or use the cache), returns the response body."""
         start = time.time()
-        headers = self.headers
-        headers["Authorization"] = f"Bearer {self.jwt_token}"
-        headers["User-Agent"] = f"pyteamtv {pyteamtv.__version__}"
+        headers = self._request_headers
 
-        # Log headers with redacted authorization
-        safe_headers = {
-            k: ("REDACTED" if k.lower() == "authorization" else v)
-            for k, v in headers.items()
-        }
-        logger.debug(f"Sending {method} request to {url} - {safe_headers}")
-
-        response = self.session.request(
-            method,
-            self._base_url + url,
-            headers=headers,
-            json=input_,
-            timeout=self.timeout,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            # Log headers with redacted authorization
+            safe_headers = {
+                k: ("REDACTED" if k.lower() == "authorization" else v)
+                for k, v in headers.items()
+            }
+            logger.debug(f"Sending {method} request to {url} - {safe_headers}")
+
+        cache_key = None
+        cache_entry = None
+        if self.cache is not None and method == "GET":
+            cache_key = self._key_prefix + url
+            cache_entry = self.cache.get(cache_key)
+            if cache_entry:
+                if cache_entry.is_fresh:
+                    logger.debug(f"Cache hit for {url}")
+                    return cache_entry.content
+                headers = {**headers, **self.cache.conditional_headers(cache_entry)}
+
+        response = self._send(method, url, headers, input_)
         took = time.time() - start
         logger.debug(f"Request took: {took * 1000:.2f}ms")
 
+        if response.status_code == 304 and cache_entry:
+            logger.debug(f"Cache revalidated for {url}")
+            cache_entry = self.cache.refresh(cache_key, url, cache_entry, response)
+            return cache_entry.content
+
+        self._raise_for_status(response, method, url, input_)
+
+        if cache_key is not None:
+            self.cache.store(cache_key, url, response)
+        elif self.cache is not None:
+            self.cache.invalidate(url)
+
+        return response.content
+
+    def request_stream(self, method, url, input_=None, chunk_size=64 * 1024):
+        """
+        Like `request`, for endpoints returning a JSON array: yields the items
+        while the response is downloaded, so memory use is bounded by the size
+        of a single item instead of the whole response.
+
+        Streamed responses bypass the cache and are not coalesced.
+        """
+        logger.debug(f"Sending streaming {method} request to {url}")
+
+        response = self._send(method, url, self._request_headers, input_, stream=True)
+        with response:
+            self._raise_for_status(response, method, url, input_)
+            yield from iter_json_array(response.iter_content(chunk_size=chunk_size))
+
+    def request_conditional(
+        self, url, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> ConditionalResponse:
+        """
+        GET `url` unless it didn't change since the response that returned
+        `etag`/`last_modified`. For callers that keep their own copy of the
+        data (like `ObservationStore`); bypasses the cache and is not coalesced.
+        """
+        headers = dict(self._request_headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        logger.debug(f"Sending conditional GET request to {url}")
+        response = self._send("GET", url, headers, None)
+        if response.status_code == 304:
+            return ConditionalResponse(None, etag, last_modified)
+
+        self._raise_for_status(response, "GET", url, None)
+        return ConditionalResponse(
+            json_codec.loads(response.content),
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+
+    def _raise_for_status(self, response, method, url, input_):
         try:
             response.raise_for_status()
         except requests.HTTPError as e:
@@ -85,8 +254,6 @@ class Requester(object):
             )
             raise requests.HTTPError(error_msg, response=response) from e
 
-        return response.json()
-
     def with_extra_headers(self, headers: dict):
         new_headers = dict(**self.headers)
         new_headers.update(headers)
@@ -95,4 +262,26 @@ class Requester(object):
             jwt_token=self.jwt_token,
             headers=new_headers,
             use_cache=self.use_cache,
+            timeout=self.timeout,
+            retry_policy=self.retry_policy,
+            retry_stats=self.retry_stats,
+            rate_limiter=self.rate_limiter,
+            session_pool=self.session_pool,
+            cache=self.cache,
+            coalesce_requests=self.coalesce_requests,
+            identity_map=self.identity_map,
+        )
+
+    def to_async(self, max_concurrency: int = 20):
+        from .async_requester import AsyncRequester
+
+        return AsyncRequester(
+            self._base_url,
+            jwt_token=self.jwt_token,
+            headers=self.headers,
+            timeout=self.timeout,
+            max_concurrency=max_concurrency,
+            retry_policy=self.retry_policy,
+            retry_stats=self.retry_stats,
+            rate_limiter=self.rate_limiter,
         )
@@ -0,0 +1,153 @@
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Optional, FrozenSet, Dict
+
+
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+_ID_PATTERN = re.compile(
+    r"^([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9]+)$",
+    re.IGNORECASE,
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header, either in seconds or as a HTTP date."""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def endpoint_key(method: str, url: str) -> str:
+    """Group urls by endpoint by replacing ids with a placeholder:
+    GET /sportingEvents/<uuid>/observations/U1 -> GET /sportingEvents/{id}/observations/U1
+    """
+    path = url.split("?", 1)[0]
+    segments = [
+        "{id}" if _ID_PATTERN.match(segment) else segment for segment in path.split("/")
+    ]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    Non-idempotent methods (POST, PATCH) are only retried on 429, as the
+    server didn't process the request in that case. The delay is an
+    exponential backoff with full jitter, unless the server sends a
+    Retry-After header. No retry is done when it would exceed `total_timeout`.
+
+    Use ``RetryPolicy(max_retries=0)`` to disable retries.
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    total_timeout: Optional[float] = 120.0
+    status_forcelist: FrozenSet[int] = frozenset([429, 500, 502, 503, 504])
+    allowed_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+
+    def get_backoff(self, attempt: int) -> float:
+        backoff = min(self.max_backoff, self.backoff_factor * (2**attempt))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return backoff
+
+    def get_retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        elapsed: float,
+        status_code: Optional[int] = None,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """
+        Return the number of seconds to wait before the next attempt, or None
+        when the request should not be retried.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Number of retries done so far
+            elapsed: Seconds since the first attempt started
+            status_code: Status code of the response, None for connection errors
+            retry_after: Value of the Retry-After response header
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        method = method.upper()
+        if status_code is None:
+            if method not in self.allowed_methods:
+                return None
+        elif status_code not in self.status_forcelist:
+            return None
+        elif status_code != 429 and method not in self.allowed_methods:
+            return None
+
+        delay = None
+        if self.respect_retry_after:
+            delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = self.get_backoff(attempt)
+
+        if self.total_timeout is not None and elapsed + delay > self.total_timeout:
+            return None
+
+        return delay
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+class RetryStats(object):
+    """Thread-safe counter of retries per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counter = Counter()
+
+    def increment(self, method: str, url: str):
+        key = endpoint_key(method, url)
+        with self._lock:
+            self._counter[key] += 1
+
+    @property
+    def total(self) -> int:
+        with self._lock:
+            return sum(self._counter.values())
+
+    def as_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counter)
+
+    def reset(self):
+        with self._lock:
+            self._counter.clear()
+
+    def __getstate__(self):
+        return {"_counter": self.as_dict()}
+
+    def __setstate__(self, state):
+        self._lock = threading.Lock()
+        self._counter = Counter(state["_counter"])
+
+    def __repr__(self):
+        return f"<RetryStats {self.as_dict()}>"
@@ -0,0 +1,95 @@
+import threading
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Default number of threads of the pools doing requests: prefetch_all,
+# fetch_observation_logs, ObservationStore.sync and the one fetching videos
+DEFAULT_MAX_WORKERS = 8
+
+# Those pools run at the same time (e.g. a sync worker waiting on the video
+# pool) and share one connection pool, which needs room for both
+DEFAULT_POOL_MAXSIZE = 2 * DEFAULT_MAX_WORKERS
+
+
+class SessionPool(object):
+    """
+    Owns the pool of keep-alive connections that is shared by a Requester and
+    all requesters derived from it via `with_extra_headers`. Per resource group
+    headers are sent per request, so they don't need a session of their own.
+
+    `requests.Session` is not thread-safe, so every thread gets its own
+    session. All of them use the same (thread-safe) connection pool.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+    ):
+        """
+        Args:
+            pool_maxsize: Maximum number of connections kept open per host.
+                          Should be at least the number of threads doing requests.
+            keep_alive: Reuse connections between requests
+        """
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sessions = weakref.WeakSet()
+        self._adapter = None
+
+    @property
+    def adapter(self) -> HTTPAdapter:
+        if self._adapter is None:
+            with self._lock:
+                if self._adapter is None:
+                    self._adapter = HTTPAdapter(
+                        pool_connections=self.pool_maxsize,
+                        pool_maxsize=self.pool_maxsize,
+                    )
+        return self._adapter
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.mount("http://", self.adapter)
+        session.mount("https://", self.adapter)
+
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """The session of the current thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._create_session()
+            with self._lock:
+                self._sessions.add(session)
+            self._local.session = session
+        return session
+
+    def close(self):
+        with self._lock:
+            for session in list(self._sessions):
+                session.close()
+            self._sessions = weakref.WeakSet()
+            self._local = threading.local()
+
+            if self._adapter is not None:
+                self._adapter.close()
+                self._adapter = None
+
+    def __getstate__(self):
+        return dict(
+            pool_maxsize=self.pool_maxsize,
+            keep_alive=self.keep_alive,
+        )
+
+    def __setstate__(self, state):
+        self.__init__(**state)
@@ -17,14 +17,18 @@ class BulkObservation(TeamTVObject):
 
     @property
     def created(self) -> datetime:
+        if self._created is None:
+            self._created = datetime.fromisoformat(
+                self._raw_created.replace("Z", "+00:00")
+            )
         return self._created
 
     def _use_attributes(self, attributes: dict):
         self._bulk_observation_id = attributes["bulkObservationId"]
         self._description = attributes["description"]
         self._observation_count = attributes["observationCount"]
-        self._created = datetime.fromisoformat(
-            attributes["created"].replace("Z", "+00:00")
-        )
+        # Parsed on first access
+        self._raw_created = attributes["created"]
+        self._created = None
 
         super()._use_attributes(attributes)
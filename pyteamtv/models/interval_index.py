@@ -0,0 +1,121 @@
+from bisect import bisect_left, bisect_right
+from typing import Generic, List as TypingList, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalIndex(Generic[T]):
+    """
+    Static interval tree over items with a `start_time` and `end_time`.
+
+    Items are sorted by start time and the sorted array is treated as an
+    implicit balanced binary tree, where every node knows the largest end time
+    of its subtree. Overlap queries take O(log n + k) for k results, so m
+    queries over a log cost O(m log n) instead of O(n * m) scans.
+
+    Items without an end time are treated as points at their start time.
+    """
+
+    def __init__(self, items: Sequence[T]):
+        intervals = []
+        for item in items:
+            start = item.start_time
+            end = item.end_time if item.end_time is not None else start
+            intervals.append((start, end, item))
+        intervals.sort(key=lambda interval: interval[0])
+
+        self._starts = [interval[0] for interval in intervals]
+        self._ends = [interval[1] for interval in intervals]
+        self._items = [interval[2] for interval in intervals]
+        self._max_ends = list(self._ends)
+        self._build(0, len(intervals))
+
+        # For nearest(): the items ordered by end time
+        by_end = sorted(range(len(intervals)), key=lambda i: self._ends[i])
+        self._ends_sorted = [self._ends[i] for i in by_end]
+        self._by_end = by_end
+
+    def _build(self, lo: int, hi: int) -> float:
+        """Fill `_max_ends` for the subtree of [lo, hi), returns its max end."""
+        if lo >= hi:
+            return float("-inf")
+        mid = (lo + hi) // 2
+        self._max_ends[mid] = max(
+            self._ends[mid], self._build(lo, mid), self._build(mid + 1, hi)
+        )
+        return self._max_ends[mid]
+
+    def __len__(self):
+        return len(self._items)
+
+    def overlapping(self, start: float, end: float) -> TypingList[T]:
+        """Items overlapping [start, end] (touching counts), ordered by start time."""
+        result = []
+        # Iterative in-order walk, pruning subtrees that end before `start` and
+        # right subtrees that start after `end`. Stack entries are
+        # (lo, hi, None) for a subtree and (i, i, item) for a result.
+        stack = [(0, len(self._items), None)]
+        while stack:
+            lo, hi, item = stack.pop()
+            if item is not None:
+                result.append(item)
+                continue
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_ends[mid] < start:
+                continue
+            if self._starts[mid] <= end:
+                stack.append((mid + 1, hi, None))
+                if self._ends[mid] >= start:
+                    stack.append((mid, mid, self._items[mid]))
+            stack.append((lo, mid, None))
+        return result
+
+    def between(self, start: float, end: float) -> TypingList[T]:
+        """Items that lie completely within [start, end], ordered by start time."""
+        lo = bisect_left(self._starts, start)
+        hi = bisect_right(self._starts, end)
+        return [self._items[i] for i in range(lo, hi) if self._ends[i] <= end]
+
+    def nearest(
+        self,
+        time: float,
+        count: Optional[int] = 1,
+        max_distance: Optional[float] = None,
+    ) -> TypingList[T]:
+        """
+        Items closest to `time`, ordered by distance: 0 for items containing
+        `time`, otherwise the gap between `time` and the item. Returns at most
+        `count` items (all when None), no further away than `max_distance`.
+        """
+        limit = float("inf") if max_distance is None else max_distance
+
+        result = self.overlapping(time, time)
+        if count is not None and len(result) >= count:
+            return result[:count]
+
+        # Items starting after `time`, by increasing start
+        after = bisect_right(self._starts, time)
+        # Items ending before `time`, by decreasing end
+        before = bisect_left(self._ends_sorted, time) - 1
+
+        while count is None or len(result) < count:
+            candidates = []
+            if after < len(self._starts):
+                candidates.append((self._starts[after] - time, 0))
+            if before >= 0:
+                candidates.append((time - self._ends_sorted[before], 1))
+            if not candidates:
+                break
+
+            distance, side = min(candidates)
+            if distance > limit:
+                break
+            if side == 0:
+                result.append(self._items[after])
+                after += 1
+            else:
+                result.append(self._items[self._by_end[before]])
+                before -= 1
+        return result
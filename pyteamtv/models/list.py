@@ -1,11 +1,38 @@
-from typing import TypeVar, Type, Generic, Optional, Callable
+import re
+from operator import attrgetter
+from typing import (
+    TypeVar,
+    Type,
+    Generic,
+    Optional,
+    Callable,
+    Iterator,
+    Iterable,
+    Union,
+    Dict,
+    Any,
+    List as TypingList,
+)
 
+from pyteamtv.exceptions import InputError
 from pyteamtv.infra.requester import Requester
+from pyteamtv.infra.session import DEFAULT_MAX_WORKERS
 
 T = TypeVar("T")
 
+Key = Union[str, Callable[[Any], Any]]
+
 
 class List(Generic[T]):
+    """
+    List of objects returned by a list endpoint.
+
+    The request is deferred until the items are used for the first time
+    (iterating, indexing, truthiness, ...), so creating a List that is never
+    used costs nothing. Call `prefetch()` to fetch it right away, or
+    `prefetch_all()` to fetch many lists concurrently.
+    """
+
     def __init__(
         self,
         content_class: Type[T],
@@ -13,17 +40,57 @@ class List(Generic[T]):
         method: str,
         url: str,
         item_filter: Optional[Callable[[T], bool]] = None,
+        data: Optional[list] = None,
+        loader: Optional[Callable[[], list]] = None,
+        id_attribute: Optional[str] = None,
     ):
         self.requester = requester
         self.content_class = content_class
         self.url = url
+        self._method = method
+        self._item_filter = item_filter
+        # Called instead of requesting `url` when the data is assembled from
+        # other requests
+        self._loader = loader
+        # Attribute used by `get_by_id`, derived from the content class if not set
+        self.id_attribute = id_attribute
+        self._loaded_items: Optional[list] = None
+        self._indexes: Dict[tuple, dict] = {}
+
+        # `data` can be passed when the response was already fetched elsewhere,
+        # for example by the AsyncRequester
+        if data is not None:
+            self._load(data)
+
+    def _load(self, data: list):
+        items = [self.content_class(self.requester, item) for item in data]
+        if self._item_filter:
+            items = [item for item in items if self._item_filter(item)]
+        self._set_items(items)
+
+    def _set_items(self, items: list):
+        self._loaded_items = items
+        self._indexes = {}
 
-        data = requester.request(method, url)
-        items = [content_class(requester, item) for item in data]
-        if item_filter:
-            self._items = [item for item in items if item_filter(item)]
-        else:
-            self._items = items
+    @property
+    def _items(self) -> list:
+        if self._loaded_items is None:
+            # Concurrent first accesses from multiple threads share a single
+            # request thanks to request coalescing
+            if self._loader is not None:
+                self._load(self._loader())
+            else:
+                self._load(self.requester.request(self._method, self.url))
+        return self._loaded_items
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_items is not None
+
+    def prefetch(self) -> "List[T]":
+        """Fetch the items now instead of on first use. Returns the list itself."""
+        self._items
+        return self
 
     def __getitem__(self, index) -> T:
         assert isinstance(index, (int, slice))
@@ -38,6 +105,58 @@ class List(Generic[T]):
             if fn(item):
                 return item
 
+    def _get_index(self, kind: str, key: Key) -> dict:
+        items = self._items
+        # Only indexes by attribute name are cached: function keys are often
+        # inline lambdas, a new object on every call
+        cacheable = isinstance(key, str)
+        index = self._indexes.get((kind, key)) if cacheable else None
+        if index is None:
+            key_fn = attrgetter(key) if cacheable else key
+            index = {}
+            if kind == "unique":
+                for item in items:
+                    index.setdefault(key_fn(item), item)
+            else:
+                for item in items:
+                    index.setdefault(key_fn(item), []).append(item)
+            if cacheable:
+                self._indexes[(kind, key)] = index
+        return index
+
+    def index_by(self, key: Key) -> Dict[Any, T]:
+        """
+        Dict of the items by `key`: an attribute name (dotted names like
+        "resource_group.name" are allowed) or a function. When multiple items
+        have the same key, the first one wins, like `find_by`.
+
+        Indexes by attribute name are built on first use and cached until the
+        list changes. Indexes by function are built on every call.
+        """
+        return self._get_index("unique", key)
+
+    def group_by(self, key: Key) -> Dict[Any, TypingList[T]]:
+        """Like `index_by`, but maps each key to the list of all its items."""
+        return self._get_index("group", key)
+
+    def get_by_id(self, id_: str) -> Optional[T]:
+        """
+        Get an item by its id, e.g. `persons.get_by_id(person_id)`. The id
+        attribute is `id_attribute`, or derived from the content class:
+        Person -> person_id.
+        """
+        return self.index_by(self._get_id_attribute()).get(id_)
+
+    def _get_id_attribute(self) -> str:
+        if self.id_attribute:
+            return self.id_attribute
+        if not isinstance(self.content_class, type):
+            raise InputError(
+                "get_by_id needs an id_attribute for lists built with a factory function"
+            )
+        name = re.sub(r"(?<!^)(?=[A-Z])", "_", self.content_class.__name__).lower()
+        return f"{name}_id"
+
     # TODO: not used yet, might be usefull
     # when /api/sportingEvent/<uuid>/videos endpoint exists
     # def create(self, body) -> T:
@@ -54,3 +173,62 @@ class List(Generic[T]):
 
     def __bool__(self):
         return len(self._items) > 0
+
+
+def prefetch_all(lists: Iterable[List], max_workers: int = DEFAULT_MAX_WORKERS):
+    """
+    Fetch the items of many lazy lists concurrently, e.g. to load everything a
+    page needs in one go::
+
+        videos, persons = prefetch_all([team.get_videos(), team.get_persons()])
+
+    Returns the lists, in the same order. Lists that were already loaded
+    aren't fetched again. The first error, if any, is raised after all
+    requests are done.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    lists = list(lists)
+    pending = [list_ for list_ in lists if not list_.is_loaded]
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            futures = [executor.submit(list_.prefetch) for list_ in pending]
+        for future in futures:
+            future.result()
+    return lists
+
+
+class StreamingList(Generic[T]):
+    """
+    Iterable over the items of a (large) list endpoint, built while the
+    response is downloaded. Items aren't kept, so memory use is bounded by a
+    single item. Every iteration does a new request.
+    """
+
+    def __init__(
+        self,
+        content_class: Type[T],
+        requester: Requester,
+        method: str,
+        url: str,
+        item_filter: Optional[Callable[[T], bool]] = None,
+    ):
+        self.requester = requester
+        self.content_class = content_class
+        self.url = url
+        self._method = method
+        self._item_filter = item_filter
+
+    def __iter__(self) -> Iterator[T]:
+        for data in self.requester.request_stream(self._method, self.url):
+            item = self.content_class(self.requester, data)
+            if not self._item_filter or self._item_filter(item):
+                yield item
+
+    def find_by(self, fn: Callable[[T], bool]) -> Optional[T]:
+        for item in self:
+            if fn(item):
+                return item
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} url={self.url}>"
@@ -14,16 +14,10 @@ class MembershipList(List):
         )
 
     def get_membership_by_resource_group_id(self, resource_group_id: str) -> Membership:
-        for membership in self._items:
-            if membership.resource_group.resource_group_id == resource_group_id:
-                return membership
-        return None
+        return self.index_by("resource_group.resource_group_id").get(resource_group_id)
 
     def get_membership_by_name(self, name: str) -> Membership:
-        for membership in self._items:
-            if membership.resource_group.name == name:
-                return membership
-        return None
+        return self.index_by("resource_group.name").get(name)
 
     def get_memberships(
         self, tenant_id: Optional[str] = None, type_: Optional[str] = None
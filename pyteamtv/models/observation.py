@@ -1,9 +1,21 @@
+import sys
 from typing import TypedDict, Union
 
 from .teamtv_object import TeamTVObject
 
 
 class Observation(TeamTVObject):
+    __slots__ = (
+        "_observation_id",
+        "_start_time",
+        "_trigger_time",
+        "_end_time",
+        "_code",
+        "_attributes",
+        "_description",
+        "_clock_id",
+    )
+
     @property
     def observation_id(self) -> str:
         return self._observation_id
@@ -41,13 +53,27 @@ class Observation(TeamTVObject):
         self._start_time = attributes["startTime"]
         self._trigger_time = attributes["triggerTime"]
         self._end_time = attributes["endTime"]
-        self._code = attributes["code"]
+        # A log has few distinct codes and clocks: share the strings instead
+        # of keeping a copy per observation
+        self._code = sys.intern(attributes["code"])
         self._attributes = attributes["attributes"] or dict()
         self._description = attributes["description"]
-        self._clock_id = attributes["clockId"]
+        self._clock_id = sys.intern(attributes["clockId"])
 
         super()._use_attributes(attributes)
 
+    def _equals_attributes(self, attributes: dict) -> bool:
+        """Whether `attributes` parse to this observation, without parsing them."""
+        return (
+            self._start_time == attributes["startTime"]
+            and self._trigger_time == attributes["triggerTime"]
+            and self._end_time == attributes["endTime"]
+            and self._code == attributes["code"]
+            and self._description == attributes["description"]
+            and self._clock_id == attributes["clockId"]
+            and self._attributes == (attributes["attributes"] or dict())
+        )
+
 
 class DictObservation(TypedDict):
     startTime: Union[str, float]
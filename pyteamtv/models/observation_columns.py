@@ -0,0 +1,167 @@
+from typing import Dict, List as TypingList, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyteamtv.models.observation import Observation
+
+
+FLOAT_COLUMNS = ("start_time", "trigger_time", "end_time")
+STRING_COLUMNS = ("observation_id", "code", "clock_id")
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "numpy is required for columnar observation logs. "
+            "Install it with: pip install pyteamtv[columnar]"
+        )
+    return numpy
+
+
+class ObservationColumns(object):
+    """
+    Columnar view of observations: `observation_id`, `code`, `clock_id`,
+    `start_time`, `trigger_time` and `end_time` in contiguous NumPy arrays,
+    for vectorized filtering, sorting and grouping::
+
+        columns = observation_log.columns
+        shots = columns.filter(columns["code"] == "SHOT").sort_by("trigger_time")
+        for observation in shots.observations():
+            ...
+
+    Operations return a new ObservationColumns sharing the Observation objects
+    of the log. Times are float64 (NaN when missing).
+    """
+
+    def __init__(self, observations: Sequence["Observation"], arrays: dict, index):
+        self._observations = observations
+        self._arrays = arrays
+        # Positions of the rows in `observations`
+        self._index = index
+
+    @classmethod
+    def from_observations(
+        cls, observations: Sequence["Observation"]
+    ) -> "ObservationColumns":
+        np = _import_numpy()
+
+        arrays = {}
+        for column in STRING_COLUMNS:
+            values = [getattr(observation, column) for observation in observations]
+            array = np.empty(len(values), dtype=object)
+            array[:] = values
+            arrays[column] = array
+        for column in FLOAT_COLUMNS:
+            arrays[column] = np.array(
+                [getattr(observation, column) for observation in observations],
+                dtype=np.float64,
+            )
+        return cls(observations, arrays, np.arange(len(observations)))
+
+    def __len__(self):
+        return len(self._index)
+
+    def __getitem__(self, column: str):
+        return self._arrays[column]
+
+    def __repr__(self):
+        return f"<ObservationColumns rows={len(self)}>"
+
+    def take(self, indices) -> "ObservationColumns":
+        """Rows at `indices` (an integer array or a boolean mask), in that order."""
+        return ObservationColumns(
+            self._observations,
+            {column: array[indices] for column, array in self._arrays.items()},
+            self._index[indices],
+        )
+
+    def filter(self, mask) -> "ObservationColumns":
+        """Rows where the boolean `mask` is True, e.g. `columns["code"] == "SHOT"`."""
+        return self.take(mask)
+
+    def between(self, column: str, start: float, end: float) -> "ObservationColumns":
+        """Rows with `start <= column <= end`."""
+        array = self._arrays[column]
+        return self.take((array >= start) & (array <= end))
+
+    def sort_by(self, column: str, descending: bool = False) -> "ObservationColumns":
+        np = _import_numpy()
+
+        order = np.argsort(self._arrays[column], kind="stable")
+        if descending:
+            order = order[::-1]
+        return self.take(order)
+
+    def group_by(self, column: str) -> Dict[object, "ObservationColumns"]:
+        """Split the rows by the values of `column`, keeping their order."""
+        np = _import_numpy()
+
+        keys, inverse = np.unique(self._arrays[column], return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(keys) + 1))
+        return {
+            key: self.take(order[bounds[i] : bounds[i + 1]])
+            for i, key in enumerate(keys.tolist())
+        }
+
+    def count_by(self, column: str) -> Dict[object, int]:
+        np = _import_numpy()
+
+        keys, counts = np.unique(self._arrays[column], return_counts=True)
+        return dict(zip(keys.tolist(), counts.tolist()))
+
+    def observations(self) -> TypingList["Observation"]:
+        return [self._observations[i] for i in self._index]
+
+    def to_arrow(self):
+        """
+        pyarrow Table of the columns. The time columns are zero-copy views of
+        the NumPy arrays, `code` and `clock_id` are dictionary encoded.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for to_arrow(). "
+                "Install it with: pip install pyteamtv[columnar]"
+            )
+
+        columns = {}
+        for column in STRING_COLUMNS:
+            array = pa.array(self._arrays[column], type=pa.string())
+            if column != "observation_id":
+                array = array.dictionary_encode()
+            columns[column] = array
+        for column in FLOAT_COLUMNS:
+            columns[column] = pa.array(self._arrays[column])
+        return pa.table(columns)
+
+    def to_polars(self):
+        try:
+            import polars
+        except ImportError:
+            raise ImportError(
+                "polars is required for to_polars(). "
+                "Install it with: pip install polars"
+            )
+
+        return polars.from_arrow(self.to_arrow())
+
+    def to_pandas(self):
+        """pandas DataFrame sharing the time arrays, with categorical code and clock_id."""
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                "pandas is required for to_pandas(). Install it with: pip install pandas"
+            )
+
+        data = {}
+        for column in STRING_COLUMNS:
+            data[column] = self._arrays[column]
+            if column != "observation_id":
+                data[column] = pd.Categorical(data[column])
+        for column in FLOAT_COLUMNS:
+            data[column] = self._arrays[column]
+        return pd.DataFrame(data, copy=False)
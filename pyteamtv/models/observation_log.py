@@ -1,14 +1,185 @@
-from typing import Type, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Type, TYPE_CHECKING, Optional, Dict, List as TypingList
 
 if TYPE_CHECKING:
     from pyteamtv.models.sporting_event import SportingEvent
 
 from pyteamtv.infra.requester import Requester
-from pyteamtv.models.list import List
+from pyteamtv.models.interval_index import IntervalIndex
+from pyteamtv.models.list import List, StreamingList
 from pyteamtv.models.observation import Observation
+from pyteamtv.models.observation_columns import ObservationColumns
 
 
-class ObservationLog(List[Observation]):
+class _ObservationLogMixin(object):
+    _clock_id: str
+    _sporting_event: "SportingEvent"
+
+    @property
+    def sporting_event(self):
+        return self._sporting_event
+
+    def get_mapping_stats(self):
+        stats = dict(success=0, failed=0)
+        for observation in self:
+            if observation.clock_id == self._clock_id:
+                stats["success"] += 1
+            else:
+                stats["failed"] += 1
+        return stats
+
+
+@dataclass
+class ObservationLogChanges:
+    """Result of `ObservationLog.refresh`."""
+
+    added: TypingList[Observation]
+    changed: TypingList[Observation]
+    removed: TypingList[Observation]
+
+    def __bool__(self):
+        return bool(self.added or self.changed or self.removed)
+
+
+class ObservationLog(_ObservationLogMixin, List[Observation]):
+    def __init__(
+        self,
+        content_class: Type[Observation],
+        requester: Requester,
+        method: str,
+        url: str,
+        clock_id: str,
+        sporting_event: "SportingEvent",
+        data: Optional[list] = None,
+    ):
+        self._columns: Optional[ObservationColumns] = None
+        self._interval_index: Optional[IntervalIndex[Observation]] = None
+        super().__init__(content_class, requester, method, url, data=data)
+        self._clock_id = clock_id
+        self._sporting_event = sporting_event
+
+    def _set_items(self, items: list):
+        super()._set_items(items)
+        self._columns = None
+        self._interval_index = None
+
+    def __reduce_ex__(self, protocol):
+        # Pickle a loaded log as the raw observation data: that is a lot
+        # smaller and faster to unpickle than the Observation objects
+        if self.is_loaded and all(
+            observation.raw_attributes is not None for observation in self
+        ):
+            return (
+                type(self),
+                (
+                    self.content_class,
+                    self.requester,
+                    self._method,
+                    self.url,
+                    self._clock_id,
+                    self._sporting_event,
+                    [observation.raw_attributes for observation in self],
+                ),
+            )
+        return super().__reduce_ex__(protocol)
+
+    def refresh(self) -> "ObservationLogChanges":
+        """
+        Fetch the log again and apply only the differences: Observation objects
+        of unchanged observations are reused, changed ones are updated in
+        place, and the columns and indexes are only rebuilt when something
+        changed. Combine with `use_cache` to turn an unchanged log into a 304.
+        """
+        if not self.is_loaded:
+            self.prefetch()
+            return ObservationLogChanges(
+                added=list(self._items), changed=[], removed=[]
+            )
+
+        data = self.requester.request(self._method, self.url)
+
+        current = {observation.observation_id: observation for observation in self}
+        items, added, changed = [], [], []
+        for attributes in data:
+            observation = current.pop(attributes["observationId"], None)
+            if observation is None:
+                observation = self.content_class(self.requester, attributes)
+                added.append(observation)
+            elif not self._is_unchanged(observation, attributes):
+                observation._update(attributes)
+                changed.append(observation)
+            items.append(observation)
+        removed = list(current.values())
+
+        if (
+            added
+            or changed
+            or removed
+            or any(a is not b for a, b in zip(items, self._loaded_items))
+        ):
+            self._set_items(items)
+        return ObservationLogChanges(added=added, changed=changed, removed=removed)
+
+    def _is_unchanged(self, observation: Observation, attributes: dict) -> bool:
+        if observation.raw_attributes is not None:
+            return observation.raw_attributes == attributes
+
+        # Raw attributes aren't kept: compare the parsed values
+        return observation._equals_attributes(attributes)
+
+    @property
+    def columns(self) -> ObservationColumns:
+        """
+        Columnar (NumPy) view of the log for vectorized filtering, sorting and
+        grouping. Built on first use and cached until the log changes.
+        """
+        if self._columns is None:
+            self._columns = ObservationColumns.from_observations(self._items)
+        return self._columns
+
+    @property
+    def interval_index(self) -> IntervalIndex[Observation]:
+        """Interval tree on start_time/end_time, built on first use."""
+        if self._interval_index is None:
+            self._interval_index = IntervalIndex(self._items)
+        return self._interval_index
+
+    def between(self, start: float, end: float) -> TypingList[Observation]:
+        """Observations that lie completely within [start, end]."""
+        return self.interval_index.between(start, end)
+
+    def overlapping(self, start: float, end: float) -> TypingList[Observation]:
+        """Observations overlapping [start, end], e.g. to build a clip."""
+        return self.interval_index.overlapping(start, end)
+
+    def nearest(
+        self,
+        time: float,
+        count: Optional[int] = 1,
+        max_distance: Optional[float] = None,
+    ) -> TypingList[Observation]:
+        """
+        Observations closest to `time`, e.g. all observations within 5 seconds
+        of another one: `nearest(observation.start_time, None, 5)`.
+        """
+        return self.interval_index.nearest(time, count, max_distance)
+
+    def to_arrow(self):
+        return self.columns.to_arrow()
+
+    def to_polars(self):
+        return self.columns.to_polars()
+
+    def to_pandas(self):
+        return self.columns.to_pandas()
+
+
+class StreamingObservationLog(_ObservationLogMixin, StreamingList[Observation]):
+    """
+    Observation log that is parsed while it's downloaded, so logs of any size
+    can be processed in bounded memory. Every iteration fetches the log again.
+    """
+
     def __init__(
         self,
         content_class: Type[Observation],
@@ -22,15 +193,43 @@ class ObservationLog(List[Observation]):
         self._clock_id = clock_id
         self._sporting_event = sporting_event
 
+
+class ObservationLogBatch(object):
+    """Result of fetching observation logs for many sporting events at once.
+
+    Iterating yields the successfully fetched logs in the order of the
+    requested sporting events, so a batch can be passed straight to
+    `DataframeBuilder.build_df`. Failed fetches are collected in `failures`,
+    keyed by sporting_event_id.
+    """
+
+    def __init__(
+        self,
+        observation_logs: TypingList[ObservationLog],
+        failures: Dict[str, Exception],
+    ):
+        self._observation_logs = observation_logs
+        self._failures = failures
+
     @property
-    def sporting_event(self):
-        return self._sporting_event
+    def observation_logs(self) -> TypingList[ObservationLog]:
+        return self._observation_logs
 
-    def get_mapping_stats(self):
-        stats = dict(success=0, failed=0)
-        for observation in self:
-            if observation.clock_id == self._clock_id:
-                stats["success"] += 1
-            else:
-                stats["failed"] += 1
-        return stats
+    @property
+    def failures(self) -> Dict[str, Exception]:
+        return self._failures
+
+    def __iter__(self):
+        return iter(self._observation_logs)
+
+    def __len__(self):
+        return len(self._observation_logs)
+
+    def __getitem__(self, index) -> ObservationLog:
+        return self._observation_logs[index]
+
+    def __repr__(self):
+        return (
+            f"<ObservationLogBatch observation_logs={len(self._observation_logs)} "
+            f"failures={len(self._failures)}>"
+        )
@@ -2,6 +2,14 @@ from .teamtv_object import TeamTVObject
 
 
 class Person(TeamTVObject):
+    __slots__ = (
+        "_person_id",
+        "_first_name",
+        "_last_name",
+        "_gender",
+        "_tags",
+    )
+
     @property
     def person_id(self):
         return self._person_id
@@ -68,6 +68,18 @@ class _ResourceGroup(TeamTVObject, _HasStorage):
             return SportType.from_sport_name(self._sport_type_value)
         return SportType.OTHER
 
+    def aio(self, max_concurrency: int = 20):
+        """
+        Return an awaitable mirror of this resource group, backed by an
+        AsyncRequester. Requires ``aiohttp``.
+
+        Args:
+            max_concurrency: Maximum number of requests in flight at once
+        """
+        from .aio import factory
+
+        return factory(self, max_concurrency=max_concurrency)
+
     def __repr__(self):
         return f"<ResourceGroup name='{self.name}'>"
 
@@ -0,0 +1,121 @@
+from typing import TYPE_CHECKING
+
+from pyteamtv.exceptions import InputError
+from pyteamtv.infra.async_requester import AsyncRequester
+from .async_capabilities import (
+    _AsyncHasTeamsMixin,
+    _AsyncHasSportingEventsMixin,
+    _AsyncHasVideosMixin,
+    _AsyncHasPersonsMixin,
+)
+
+if TYPE_CHECKING:
+    from . import _ResourceGroup
+
+
+class _AsyncResourceGroup(object):
+    """Awaitable mirror of a resource group.
+
+    Use it as an async context manager so the underlying HTTP session is
+    closed when done::
+
+        async with team.aio() as aio_team:
+            sporting_events = await aio_team.get_sporting_events()
+            observation_logs = await asyncio.gather(
+                *(aio_team.get_observation_log(se) for se in sporting_events)
+            )
+    """
+
+    def __init__(self, resource_group: "_ResourceGroup", requester: AsyncRequester):
+        self._resource_group = resource_group
+        self._requester = requester
+
+    @property
+    def resource_group(self):
+        return self._resource_group
+
+    @property
+    def resource_group_id(self):
+        return self._resource_group.resource_group_id
+
+    @property
+    def name(self):
+        return self._resource_group.name
+
+    async def close(self):
+        await self._requester.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __repr__(self):
+        return f"<AsyncResourceGroup name='{self.name}'>"
+
+
+class AsyncTeamResourceGroup(
+    _AsyncResourceGroup,
+    _AsyncHasTeamsMixin,
+    _AsyncHasSportingEventsMixin,
+    _AsyncHasVideosMixin,
+    _AsyncHasPersonsMixin,
+):
+    pass
+
+
+class AsyncClubResourceGroup(
+    _AsyncResourceGroup,
+    _AsyncHasTeamsMixin,
+    _AsyncHasSportingEventsMixin,
+    _AsyncHasVideosMixin,
+):
+    pass
+
+
+class AsyncSharingGroupResourceGroup(
+    _AsyncResourceGroup,
+    _AsyncHasTeamsMixin,
+    _AsyncHasPersonsMixin,
+    _AsyncHasSportingEventsMixin,
+    _AsyncHasVideosMixin,
+):
+    pass
+
+
+class AsyncPersonResourceGroup(
+    _AsyncResourceGroup,
+    _AsyncHasTeamsMixin,
+    _AsyncHasSportingEventsMixin,
+    _AsyncHasVideosMixin,
+):
+    pass
+
+
+def factory(resource_group: "_ResourceGroup", max_concurrency: int = 20):
+    from .club import ClubResourceGroup
+    from .person import PersonResourceGroup
+    from .sharing_group import SharingGroupResourceGroup
+    from .team import TeamResourceGroup
+    from .user import UserResourceGroup
+
+    _CLASSES = {
+        TeamResourceGroup: AsyncTeamResourceGroup,
+        ClubResourceGroup: AsyncClubResourceGroup,
+        SharingGroupResourceGroup: AsyncSharingGroupResourceGroup,
+        PersonResourceGroup: AsyncPersonResourceGroup,
+        UserResourceGroup: AsyncPersonResourceGroup,
+    }
+
+    class_ = _CLASSES.get(type(resource_group))
+    if class_ is None:
+        raise InputError(
+            f"No async API available for {type(resource_group).__name__}. "
+            f"Supported: {', '.join(sorted({c.__name__ for c in _CLASSES}))}"
+        )
+
+    return class_(
+        resource_group,
+        resource_group._requester.to_async(max_concurrency=max_concurrency),
+    )
@@ -0,0 +1,83 @@
+from typing import Optional, TYPE_CHECKING
+
+from pyteamtv.infra.async_requester import AsyncRequester
+from ..list import List
+from ..observation import Observation
+from ..observation_log import ObservationLog
+from ..person import Person
+from ..sporting_event import SportingEvent
+from ..team import Team
+from ..video import Video
+
+if TYPE_CHECKING:
+    from . import _ResourceGroup
+
+
+class _AsyncBaseMixin(object):
+    _requester: AsyncRequester
+
+    # The sync resource group this mirror belongs to. Models are built with its
+    # (blocking) requester so they behave exactly like the ones returned by
+    # the sync API.
+    _resource_group: "_ResourceGroup"
+
+    async def _get_list(self, content_class, url: str, item_filter=None) -> List:
+        data = await self._requester.request("GET", url)
+        return List(
+            content_class,
+            self._resource_group._requester,
+            "GET",
+            url,
+            item_filter=item_filter,
+            data=data,
+        )
+
+
+class _AsyncHasTeamsMixin(_AsyncBaseMixin):
+    async def get_teams(self) -> List[Team]:
+        return await self._get_list(Team, "/teams")
+
+
+class _AsyncHasSportingEventsMixin(_AsyncBaseMixin):
+    async def get_sporting_events(self) -> List[SportingEvent]:
+        return await self._get_list(SportingEvent, "/sportingEvents")
+
+    async def get_sporting_event(self, sporting_event_id: str) -> SportingEvent:
+        data = await self._requester.request(
+            "GET", f"/sportingEvents/{sporting_event_id}"
+        )
+        return SportingEvent(self._resource_group._requester, data)
+
+    async def get_observation_log(
+        self,
+        sporting_event: SportingEvent,
+        video_id: Optional[str] = None,
+        clock_id: Optional[str] = None,
+    ) -> ObservationLog:
+        clock_id = sporting_event._resolve_clock_id(video_id, clock_id)
+        url = sporting_event._observation_log_url(clock_id)
+
+        data = await self._requester.request("GET", url)
+        return ObservationLog(
+            Observation,
+            self._resource_group._requester,
+            "GET",
+            url,
+            clock_id,
+            sporting_event,
+            data=data,
+        )
+
+
+class _AsyncHasVideosMixin(_AsyncBaseMixin):
+    async def get_videos(self) -> List[Video]:
+        return await self._get_list(Video, "/videos")
+
+    async def get_video(self, video_id: str) -> Video:
+        data = await self._requester.request("GET", f"/videos/{video_id}")
+        return Video(self._resource_group._requester, data)
+
+
+class _AsyncHasPersonsMixin(_AsyncBaseMixin):
+    async def get_persons(self) -> List[Person]:
+        return await self._get_list(Person, "/persons")
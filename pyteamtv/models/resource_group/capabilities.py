@@ -1,8 +1,11 @@
+import logging
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Iterable, Literal, Optional
 
 from pyteamtv.infra.requester import Requester
-from ..list import List
+from pyteamtv.infra.session import DEFAULT_MAX_WORKERS
+from ..list import List, StreamingList
+from ..observation_log import ObservationLog, ObservationLogBatch
 from ..person import Person
 
 from ..sporting_event import SportingEvent
@@ -13,6 +16,8 @@ from ..app_storage import AppStorageTokens
 from ..playlist import Playlist
 from ..custom_tag import CustomTag
 
+logger = logging.getLogger(__name__)
+
 
 def iso8601(datetime_: datetime):
     assert datetime_.tzname() == "UTC", datetime_
@@ -73,9 +78,55 @@ class _HasSportingEventsMixin(BaseMixin):
             SportingEvent, self._requester, "GET", "/sportingEvents"
         )
 
-    def get_sporting_event(self, sporting_event_id: str):
-        data = self._requester.request("GET", f"/sportingEvents/{sporting_event_id}")
-        return SportingEvent(self._requester, data)
+    def get_sporting_event(self, sporting_event_id: str, refresh: bool = False):
+        return SportingEvent._fetch(
+            self._requester,
+            sporting_event_id,
+            f"/sportingEvents/{sporting_event_id}",
+            refresh=refresh,
+        )
+
+    def fetch_observation_logs(
+        self,
+        sporting_events: Iterable[SportingEvent],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> ObservationLogBatch:
+        """
+        Fetch the observation logs of many sporting events concurrently.
+
+        Args:
+            sporting_events: Sporting events to fetch the (main) observation log for
+            max_workers: Maximum number of concurrent requests (default: 8)
+
+        Returns:
+            ObservationLogBatch with the logs in input order. A failing sporting
+            event doesn't abort the batch; its exception ends up in `failures`.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        sporting_events = list(sporting_events)
+
+        def fetch(sporting_event: SportingEvent) -> ObservationLog:
+            return sporting_event.get_observation_log().prefetch()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(fetch, sporting_event)
+                for sporting_event in sporting_events
+            ]
+
+        observation_logs = []
+        failures = {}
+        for sporting_event, future in zip(sporting_events, futures):
+            try:
+                observation_logs.append(future.result())
+            except Exception as e:
+                logger.warning(
+                    f"Failed to fetch observation log of {sporting_event.sporting_event_id}: {e}"
+                )
+                failures[sporting_event.sporting_event_id] = e
+
+        return ObservationLogBatch(observation_logs, failures)
 
     def create_sporting_event(
         self,
@@ -101,13 +152,15 @@ class _HasSportingEventsMixin(BaseMixin):
 
 
 class _HasVideosMixin(BaseMixin):
-    def get_videos(self):
+    def get_videos(self, stream: bool = False):
+        if stream:
+            return StreamingList(Video, self._requester, "GET", "/videos")
         return List(Video, self._requester, "GET", "/videos")
 
-    def get_video(self, video_id):
-        data = self._requester.request("GET", f"/videos/{video_id}")
-
-        return Video(self._requester, data)
+    def get_video(self, video_id, refresh: bool = False):
+        return Video._fetch(
+            self._requester, video_id, f"/videos/{video_id}", refresh=refresh
+        )
 
     def upload_video(
         self,
@@ -216,7 +269,13 @@ class _HasResourceGroupsMixin(BaseMixin):
     def get_resource_groups(self):
         from .factory import factory
 
-        return List(factory, self._requester, "GET", "/resourceGroups")
+        return List(
+            factory,
+            self._requester,
+            "GET",
+            "/resourceGroups",
+            id_attribute="resource_group_id",
+        )
 
     def join(self, resource_group_id: str):
         self._requester.request("POST", f"/resourceGroups/{resource_group_id}/join")
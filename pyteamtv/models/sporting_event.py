@@ -1,5 +1,7 @@
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Union, Dict, Any
 
@@ -8,15 +10,17 @@ from .event_stream import EventStream
 from .line_up import LineUp
 from .list import List
 from .observation import Observation, DictObservation
-from .observation_log import ObservationLog
+from .observation_log import ObservationLog, StreamingObservationLog
 from .team import Team
 from .teamtv_object import TeamTVObject
 from .video import Video
 
+import requests
 from tusclient.uploader import Uploader
 
 from ..exceptions import InputError
 from ..infra.requester import Requester
+from ..infra.session import DEFAULT_MAX_WORKERS
 
 import logging
 
@@ -58,6 +62,26 @@ def patch_tusclient():
 patch_tusclient()
 
 
+_video_executor: Optional[ThreadPoolExecutor] = None
+_video_executor_lock = threading.Lock()
+
+
+def _get_video_executor() -> ThreadPoolExecutor:
+    """
+    Executor for fetching videos by id, shared by all sporting events so
+    calls from other pools (e.g. `fetch_observation_logs`) don't start a pool
+    of their own. Its tasks never wait on other tasks, so it can't deadlock.
+    """
+    global _video_executor
+
+    with _video_executor_lock:
+        if _video_executor is None:
+            _video_executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="pyteamtv-videos"
+            )
+        return _video_executor
+
+
 class Clock(TeamTVObject):
     @property
     def clock_id(self):
@@ -65,6 +89,21 @@ class Clock(TeamTVObject):
 
     @property
     def synchronization_points(self):
+        if self._synchronization_points is None:
+            self._synchronization_points = [
+                {
+                    "type": synchronization_point["type"],
+                    "key": synchronization_point["key"],
+                    "time": (
+                        float(synchronization_point["time"])
+                        if self._clock_id != "U1"
+                        else datetime.fromisoformat(
+                            synchronization_point["time"].replace("Z", "+00:00")
+                        )
+                    ),
+                }
+                for synchronization_point in self._raw_synchronization_points
+            ]
         return self._synchronization_points
 
     def add_synchronization_point(
@@ -87,7 +126,7 @@ class Clock(TeamTVObject):
         )
 
         # TODO: maybe get this one from backend
-        self._synchronization_points.append(
+        self.synchronization_points.append(
             {"type": type_, "key": str(key), "time": time}
         )
 
@@ -99,46 +138,52 @@ class Clock(TeamTVObject):
         )
 
         # TODO: maybe get this one from backend
-        for i, synchronization_point in enumerate(self._synchronization_points):
+        for i, synchronization_point in enumerate(self.synchronization_points):
             if synchronization_point["type"] == type_ and synchronization_point[
                 "key"
             ] == str(key):
-                self._synchronization_points.pop(i)
+                self.synchronization_points.pop(i)
                 break
 
     def _use_attributes(self, attributes: dict):
         self._sporting_event_id = attributes["sportingEventId"]
         self._clock_id = attributes["clockId"]
-        self._synchronization_points = [
-            {
-                "type": synchronization_point["type"],
-                "key": synchronization_point["key"],
-                "time": (
-                    float(synchronization_point["time"])
-                    if self._clock_id != "U1"
-                    else datetime.fromisoformat(
-                        synchronization_point["time"].replace("Z", "+00:00")
-                    )
-                ),
-            }
-            for synchronization_point in attributes["synchronizationPoints"]
-        ]
+        # Parsed on first access
+        self._raw_synchronization_points = attributes["synchronizationPoints"]
+        self._synchronization_points = None
 
         super()._use_attributes(attributes)
 
     def __repr__(self):
-        return f"<Clock id={self._clock_id} synchronization_points={self._synchronization_points}>"
+        return f"<Clock id={self._clock_id} synchronization_points={self.synchronization_points}>"
 
 
 class SportingEvent(TeamTVObject):
-    def __new__(cls, requester: Requester, attributes: dict):
-        if attributes["type"] == "match":
+    __slots__ = (
+        "_name",
+        "_sporting_event_id",
+        "_tags",
+        "_video_ids",
+        "_clocks",
+        "_raw_scheduled_at",
+        "_scheduled_at",
+        "_type",
+        "_outcome",
+    )
+
+    def __new__(cls, requester: Requester = None, attributes: dict = None):
+        # Unpickling calls __new__ without arguments, with the right class
+        if attributes is not None and attributes["type"] == "match":
             return super().__new__(MatchSportingEvent)
         else:
             return super().__new__(cls)
 
     @property
     def scheduled_at(self) -> datetime:
+        if self._scheduled_at is None:
+            self._scheduled_at = datetime.fromisoformat(
+                self._raw_scheduled_at.replace("Z", "+00:00")
+            )
         return self._scheduled_at
 
     @property
@@ -171,11 +216,10 @@ class SportingEvent(TeamTVObject):
     def original(self) -> Optional["SportingEvent"]:
         original_sporting_event_id = self.tags.get("copyOf")
         if original_sporting_event_id:
-            return SportingEvent(
+            return SportingEvent._fetch(
                 self._requester,
-                self._requester.request(
-                    "GET", f"/sportingEvents/{original_sporting_event_id}"
-                ),
+                original_sporting_event_id,
+                f"/sportingEvents/{original_sporting_event_id}",
             )
 
     def get_clock(self, id_: str) -> Optional[Clock]:
@@ -192,9 +236,7 @@ class SportingEvent(TeamTVObject):
             {"sportingEventId": self.sporting_event_id, **self._clocks[id_]},
         )
 
-    def get_observation_log(
-        self, video_id: str = None, clock_id: str = None
-    ) -> ObservationLog:
+    def _resolve_clock_id(self, video_id: str = None, clock_id: str = None) -> str:
         if not clock_id:
             if not video_id:
                 video_id = self.main_video_id
@@ -203,12 +245,28 @@ class SportingEvent(TeamTVObject):
                 clock_id = self._clocks[video_id]["clockId"]
             else:
                 clock_id = "U1"
+        return clock_id
+
+    def _observation_log_url(self, clock_id: str) -> str:
+        return f"/sportingEvents/{self.sporting_event_id}/observations/{clock_id}"
+
+    def get_observation_log(
+        self, video_id: str = None, clock_id: str = None, stream: bool = False
+    ) -> Union[ObservationLog, StreamingObservationLog]:
+        """
+        Get the observation log of a clock (default: the clock of the main video).
+
+        With `stream=True` a StreamingObservationLog is returned: observations
+        are parsed while the response is downloaded instead of all at once.
+        """
+        clock_id = self._resolve_clock_id(video_id, clock_id)
 
-        return ObservationLog(
+        log_class = StreamingObservationLog if stream else ObservationLog
+        return log_class(
             Observation,
             self._requester,
             "GET",
-            f"/sportingEvents/{self.sporting_event_id}/observations/{clock_id}",
+            self._observation_log_url(clock_id),
             clock_id,
             self,
         )
@@ -257,19 +315,47 @@ class SportingEvent(TeamTVObject):
 
         self.add_bulk_observation(observations, description)
 
-    def get_videos(self) -> List[Video]:
-        def _filter(video: Video) -> bool:
-            return video.video_id in self._video_ids
+    def _get_videos_data(self) -> list:
+        """
+        Fetch the videos of this sporting event by id, instead of the whole
+        /videos collection of the resource group. Videos that don't exist
+        (anymore) are skipped.
+        """
+
+        def fetch(video_id: str) -> Optional[dict]:
+            try:
+                return self._requester.request("GET", f"/videos/{video_id}")
+            except requests.HTTPError as e:
+                if e.response is not None and e.response.status_code == 404:
+                    return None
+                raise
+
+        videos = list(_get_video_executor().map(fetch, self._video_ids))
+        return [video for video in videos if video is not None]
 
-        return List(Video, self._requester, "GET", "/videos", item_filter=_filter)
+    def get_videos(self) -> List[Video]:
+        """
+        The videos of this sporting event, fetched by id on first use. A video
+        that returns 404 (e.g. it was deleted) is left out instead of raising.
+        """
+        return List(
+            Video, self._requester, "GET", "/videos", loader=self._get_videos_data
+        )
 
     def get_videos_by_tags(self, **tags) -> List[Video]:
+        """Like `get_videos`, only the videos with all the given tags."""
+
         def _filter(video: Video) -> bool:
-            return video.video_id in self._video_ids and all(
-                [video.tags.get(k) == v for k, v in tags.items()]
-            )
+            return all([video.tags.get(k) == v for k, v in tags.items()])
 
-        return List(Video, self._requester, "GET", "/videos", item_filter=_filter)
+        return List(
+            Video,
+            self._requester,
+            "GET",
+            "/videos",
+            item_filter=_filter,
+            loader=self._get_videos_data,
+        )
 
     def get_event_streams(self) -> List[EventStream]:
         return List(
@@ -632,19 +718,25 @@ class SportingEvent(TeamTVObject):
         self._tags = attributes.get("tags") or {}
         self._video_ids = attributes.get("videoIds", [])
         self._clocks = attributes["clocks"]
-        self._scheduled_at = datetime.fromisoformat(
-            attributes["scheduledAt"].replace("Z", "+00:00")
-        )
+        # Parsed on first access
+        self._raw_scheduled_at = attributes["scheduledAt"]
+        self._scheduled_at = None
         self._type = attributes["type"]
         self._outcome = attributes.get("outcome")
 
         super()._use_attributes(attributes)
 
     def __str__(self):
-        return f"{self._scheduled_at.strftime('%d/%m/%y')} {self._name}"
+        return f"{self.scheduled_at.strftime('%d/%m/%y')} {self._name}"
 
 
 class MatchSportingEvent(SportingEvent):
+    __slots__ = (
+        "_line_up_id",
+        "_home_team_id",
+        "_away_team_id",
+    )
+
     @property
     def home_team_id(self):
         return self._home_team_id
@@ -672,19 +764,27 @@ class MatchSportingEvent(SportingEvent):
         else:
             return None
 
-    def get_line_up(self) -> LineUp:
-        data = self._requester.request("GET", f"/lineUps/{self.line_up_id}")
-        data["sportingEvent"] = self
-        return LineUp(self._requester, data)
+    def get_line_up(self, refresh: bool = False) -> LineUp:
+        return LineUp._fetch(
+            self._requester,
+            self.line_up_id,
+            f"/lineUps/{self.line_up_id}",
+            refresh=refresh,
+            extra_attributes=dict(sportingEvent=self),
+        )
 
-    def get_home_team(self) -> Team:
-        return Team(
+    def get_home_team(self, refresh: bool = False) -> Team:
+        return Team._fetch(
             self._requester,
-            self._requester.request("GET", f"/teams/{self.home_team_id}"),
+            self.home_team_id,
+            f"/teams/{self.home_team_id}",
+            refresh=refresh,
         )
 
-    def get_away_team(self) -> Team:
-        return Team(
+    def get_away_team(self, refresh: bool = False) -> Team:
+        return Team._fetch(
             self._requester,
-            self._requester.request("GET", f"/teams/{self.away_team_id}"),
+            self.away_team_id,
+            f"/teams/{self.away_team_id}",
+            refresh=refresh,
         )
@@ -1,13 +1,70 @@
+from typing import Optional
+
 from pyteamtv.infra.requester import Requester
 
 
 class TeamTVObject(object):
+    # High-volume subclasses (Observation, Video, Person, SportingEvent) define
+    # __slots__ too, so their instances don't carry a __dict__
+    __slots__ = (
+        "_requester",
+        "__attributes",
+        "_metadata",
+    )
+
+    # Set to False (per class, e.g. `Observation.keep_raw_attributes = False`)
+    # to not keep the raw API response of every object. Saves memory when
+    # loading millions of objects; `raw_attributes` is None then.
+    keep_raw_attributes = True
+
     def __init__(self, requester: Requester, attributes: dict):
         self._requester = requester
-        self.__attributes = attributes
+        self._update(attributes)
+
+    def _update(self, attributes: dict):
+        self.__attributes = attributes if self.keep_raw_attributes else None
 
         self._use_attributes(attributes)
 
+    @classmethod
+    def _fetch(
+        cls,
+        requester: Requester,
+        id_: str,
+        url: str,
+        refresh: bool = False,
+        extra_attributes: Optional[dict] = None,
+    ):
+        """
+        GET a single object. When the requester has an identity map, an object
+        fetched before is returned as-is, or updated in place when `refresh`.
+        """
+
+        def fetch() -> dict:
+            data = requester.request("GET", url)
+            return dict(data, **extra_attributes) if extra_attributes else data
+
+        identity_map = requester.identity_map
+        if identity_map is None:
+            return cls(requester, fetch())
+
+        # Objects are per requester: the same id fetched through another
+        # resource group has other metadata and another requester
+        scope = requester._key_prefix
+        if refresh:
+            data = fetch()
+            obj = identity_map.get(scope, cls, id_)
+            if obj is not None:
+                obj._update(data)
+                return obj
+            return identity_map.get_or_create(
+                scope, cls, id_, lambda: cls(requester, data)
+            )
+
+        return identity_map.get_or_create(
+            scope, cls, id_, lambda: cls(requester, fetch())
+        )
+
     @property
     def raw_attributes(self):
         return self.__attributes
@@ -16,9 +73,14 @@ class TeamTVObject(object):
     def metadata(self):
         return self._metadata
 
+    @property
+    def _shared_type(self):
+        return self._metadata.get("source", {}).get("type", {})
+
     @property
     def is_local(self):
-        return self._is_local
+        shared_type = self._shared_type
+        return (shared_type is None) or (shared_type == "ResourceGroup")
 
     @property
     def shared_resource_group(self):
@@ -29,25 +91,21 @@ class TeamTVObject(object):
             dict or None: Dictionary with 'name' and 'id' keys if from shared resource group, None otherwise.
             Example: {'name': 'HHK 2025-2026', 'id': 'fd762628-932b-11f0-b457-914324141087'}
         """
-        return self._shared_resource_group
-
-    def _use_attributes(self, attributes: dict):
-        self._metadata = attributes.get("_metadata", {})
-
-        shared_type = self._metadata.get("source", {}).get("type", {})
-        self._is_local = (shared_type is None) or (shared_type == "ResourceGroup")
-
-        # Extract shared resource group info
-        self._shared_resource_group = None
-        if shared_type == "SharedResourceGroup":
+        if self._shared_type == "SharedResourceGroup":
             share = self._metadata.get("source", {}).get("share", {})
             resource_group = share.get("resourceGroup", {})
             if resource_group:
-                self._shared_resource_group = {
+                return {
                     "name": resource_group.get("targetResourceName"),
                     "id": resource_group.get("resourceGroupId"),
                     "tenant_id": resource_group.get("tenantId"),
                 }
+        return None
+
+    def _use_attributes(self, attributes: dict):
+        # Keep this cheap, it runs for every object in a List. Derive values
+        # that need parsing in their property, on first access.
+        self._metadata = attributes.get("_metadata", {})
 
     def has_privilege(self, action: str) -> bool:
         for privilege, status in self.metadata.get("privilegesV2", {}).items():
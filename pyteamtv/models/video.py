@@ -2,6 +2,16 @@ from .teamtv_object import TeamTVObject
 
 
 class Video(TeamTVObject):
+    __slots__ = (
+        "_video_id",
+        "_parts",
+        "_media_url",
+        "_state",
+        "_tags",
+        "_livestream",
+        "_skip_transcoding",
+    )
+
     @property
     def video_id(self):
         return self._video_id
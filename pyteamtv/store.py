@@ -0,0 +1,437 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List as TypingList, Optional, Union
+from urllib.parse import quote
+
+from pyteamtv.infra import json_codec
+from pyteamtv.infra.session import DEFAULT_MAX_WORKERS
+from pyteamtv.models.observation import Observation
+from pyteamtv.models.observation_columns import FLOAT_COLUMNS, ObservationColumns
+from pyteamtv.models.observation_log import ObservationLog
+from pyteamtv.models.sporting_event import SportingEvent
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for ObservationStore. "
+            "Install it with: pip install pyteamtv[columnar]"
+        )
+    return pyarrow
+
+
+def _content_hash(data: list) -> str:
+    # Canonical JSON, so the hash doesn't depend on the installed codec or on
+    # the key order of the response
+    content = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class SyncResult:
+    """
+    Result of `ObservationStore.sync`, lists of sporting_event_ids. `fetched`
+    are the logs that were new or changed and have been (re)written.
+    """
+
+    fetched: TypingList[str] = field(default_factory=list)
+    unchanged: TypingList[str] = field(default_factory=list)
+    removed: TypingList[str] = field(default_factory=list)
+    failures: Dict[str, Exception] = field(default_factory=dict)
+
+
+class ObservationStore(object):
+    """
+    Local copy of the observation logs of a resource group, stored as Parquet
+    files partitioned by sporting event and clock::
+
+        store = ObservationStore("~/teamtv-data")
+        store.sync(team)
+        df = store.to_polars()
+
+    `sync` only rewrites the logs that are new or changed since the last sync.
+    A stored log isn't requested at all when the sporting event didn't change
+    since the log was last checked: when the listing has an `updatedAt` from
+    before that, or otherwise when the sporting event was scheduled more than
+    `settled_after` (default: 7 days) before that. Other stored logs are
+    revalidated with a conditional request when the API returned an
+    ETag/Last-Modified header for them, so an unchanged log costs a 304, or
+    downloaded and compared to the stored one by hash. Pass `force=True` to
+    download and rewrite everything.
+
+    Reads never hit the API and memory-map the files. Layout::
+
+        <path>/manifest.json
+        <path>/observations/sporting_event_id=<id>/<clock_id>.parquet
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self._path = Path(path).expanduser()
+        self._observations_path = self._path / "observations"
+        self._manifest_path = self._path / "manifest.json"
+        self._lock = threading.Lock()
+        self._manifest = self._load_manifest()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        """When the last sync started, None when the store was never synced."""
+        watermark = self._manifest.get("watermark")
+        return datetime.fromisoformat(watermark) if watermark else None
+
+    @property
+    def sporting_event_ids(self) -> TypingList[str]:
+        return list(self._manifest["sportingEvents"])
+
+    def __len__(self):
+        return len(self._manifest["sportingEvents"])
+
+    def __contains__(self, sporting_event_id: str):
+        return sporting_event_id in self._manifest["sportingEvents"]
+
+    def __repr__(self):
+        return f"<ObservationStore path={self._path} sporting_events={len(self)}>"
+
+    def _load_manifest(self) -> dict:
+        if not self._manifest_path.exists():
+            return {
+                "version": MANIFEST_VERSION,
+                "watermark": None,
+                "sportingEvents": {},
+            }
+
+        with open(self._manifest_path, "r", encoding="utf-8") as fp:
+            manifest = json.load(fp)
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(
+                f"Unsupported ObservationStore manifest version: {manifest.get('version')}"
+            )
+        return manifest
+
+    def _save_manifest(self):
+        self._path.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            json.dump(self._manifest, fp, indent=2, sort_keys=True)
+        os.replace(tmp_path, self._manifest_path)
+
+    def _partition_path(self, sporting_event_id: str) -> Path:
+        return (
+            self._observations_path
+            / f"sporting_event_id={quote(sporting_event_id, safe='')}"
+        )
+
+    def _file_path(self, sporting_event_id: str, clock_id: str) -> Path:
+        return (
+            self._partition_path(sporting_event_id)
+            / f"{quote(clock_id, safe='')}.parquet"
+        )
+
+    def sync(
+        self,
+        resource_group,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        force: bool = False,
+        prune: bool = False,
+        settled_after: Optional[timedelta] = timedelta(days=7),
+    ) -> SyncResult:
+        """
+        Bring the store up to date with the sporting events of `resource_group`.
+
+        Args:
+            resource_group: Resource group to sync the (main) observation logs of
+            max_workers: Maximum number of concurrent requests (default: 8)
+            force: Download all logs, also the unchanged ones
+            prune: Remove sporting events that are no longer in the resource group
+            settled_after: Don't check the stored logs of sporting events
+                without `updatedAt` that were scheduled this long before
+                their last check. None to check them on every sync.
+
+        Returns:
+            SyncResult. A failing sporting event doesn't abort the sync; its
+            exception ends up in `failures` and it's retried on the next sync.
+        """
+        started_at = _now()
+        sporting_events = list(resource_group.get_sporting_events())
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._sync_sporting_event,
+                    sporting_event,
+                    force,
+                    started_at,
+                    settled_after,
+                )
+                for sporting_event in sporting_events
+            ]
+
+        result = SyncResult()
+        for sporting_event, future in zip(sporting_events, futures):
+            sporting_event_id = sporting_event.sporting_event_id
+            try:
+                fetched = future.result()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to sync observation log of {sporting_event_id}: {e}"
+                )
+                result.failures[sporting_event_id] = e
+                continue
+            if fetched:
+                result.fetched.append(sporting_event_id)
+            else:
+                result.unchanged.append(sporting_event_id)
+
+        if prune:
+            listed = {
+                sporting_event.sporting_event_id for sporting_event in sporting_events
+            }
+            for sporting_event_id in self.sporting_event_ids:
+                if sporting_event_id not in listed:
+                    self.remove(sporting_event_id, save=False)
+                    result.removed.append(sporting_event_id)
+
+        self._manifest["watermark"] = started_at
+        self._save_manifest()
+        return result
+
+    @staticmethod
+    def _is_settled(
+        sporting_event: SportingEvent,
+        checked_at: Optional[str],
+        settled_after: Optional[timedelta],
+    ) -> bool:
+        """Whether the sporting event didn't change since its log was checked."""
+        if checked_at is None:
+            return False
+        checked_at = datetime.fromisoformat(checked_at)
+
+        updated_at = (sporting_event.raw_attributes or {}).get("updatedAt")
+        if updated_at:
+            return _parse_datetime(updated_at) < checked_at
+        if settled_after is None:
+            return False
+        return sporting_event.scheduled_at + settled_after < checked_at
+
+    def _sync_sporting_event(
+        self,
+        sporting_event: SportingEvent,
+        force: bool,
+        started_at: str,
+        settled_after: Optional[timedelta],
+    ) -> bool:
+        """Returns whether the log was new or changed, and written."""
+        sporting_event_id = sporting_event.sporting_event_id
+        clock_id = sporting_event._resolve_clock_id()
+
+        with self._lock:
+            entry = self._manifest["sportingEvents"].get(sporting_event_id)
+        is_stored = (
+            entry is not None
+            and entry["clockId"] == clock_id
+            and self._file_path(sporting_event_id, clock_id).exists()
+            and not force
+        )
+
+        if is_stored and self._is_settled(
+            sporting_event, entry.get("checkedAt"), settled_after
+        ):
+            return False
+
+        etag = last_modified = None
+        if is_stored:
+            etag, last_modified = entry["etag"], entry["lastModified"]
+
+        response = sporting_event._requester.request_conditional(
+            sporting_event._observation_log_url(clock_id), etag, last_modified
+        )
+        if response.not_modified:
+            with self._lock:
+                entry["checkedAt"] = started_at
+            return False
+
+        # Without validators (or with validators that changed while the data
+        # didn't) compare the content itself
+        content_hash = _content_hash(response.data)
+        if is_stored and entry.get("contentHash") == content_hash:
+            with self._lock:
+                entry["etag"] = response.etag
+                entry["lastModified"] = response.last_modified
+                entry["checkedAt"] = started_at
+            return False
+
+        self._write(sporting_event_id, clock_id, response.data)
+        with self._lock:
+            if entry and entry["clockId"] != clock_id:
+                self._file_path(sporting_event_id, entry["clockId"]).unlink(
+                    missing_ok=True
+                )
+            self._manifest["sportingEvents"][sporting_event_id] = {
+                "checkedAt": started_at,
+                "clockId": clock_id,
+                "contentHash": content_hash,
+                "etag": response.etag,
+                "lastModified": response.last_modified,
+                "observationCount": len(response.data),
+                "syncedAt": _now(),
+            }
+        return True
+
+    def _write(self, sporting_event_id: str, clock_id: str, data: list):
+        pa = _import_pyarrow()
+
+        observations = [Observation(None, attributes) for attributes in data]
+        columns = ObservationColumns.from_observations(observations)
+        table = columns.to_arrow()
+        for column in FLOAT_COLUMNS:
+            # Store missing times as null instead of NaN
+            table = table.set_column(
+                table.schema.get_field_index(column),
+                column,
+                pa.array(columns[column], from_pandas=True),
+            )
+        table = table.append_column(
+            "description",
+            pa.array(
+                [observation.description for observation in observations], pa.string()
+            ),
+        ).append_column(
+            "attributes",
+            pa.array(
+                [
+                    json_codec.dumps(observation.attributes).decode("utf-8")
+                    for observation in observations
+                ],
+                pa.string(),
+            ),
+        )
+
+        file_path = self._file_path(sporting_event_id, clock_id)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = file_path.with_suffix(".parquet.tmp")
+        pa.parquet.write_table(table, tmp_path)
+        os.replace(tmp_path, file_path)
+
+    def remove(self, sporting_event_id: str, save: bool = True):
+        """Remove the stored logs of a sporting event."""
+        with self._lock:
+            entry = self._manifest["sportingEvents"].pop(sporting_event_id, None)
+        if entry is None:
+            return
+
+        partition_path = self._partition_path(sporting_event_id)
+        self._file_path(sporting_event_id, entry["clockId"]).unlink(missing_ok=True)
+        if partition_path.exists() and not any(partition_path.iterdir()):
+            partition_path.rmdir()
+        if save:
+            self._save_manifest()
+
+    def read(self, sporting_event_id: Optional[str] = None, columns=None):
+        """
+        Memory-mapped pyarrow Table of the stored observations: of one sporting
+        event, or of all of them with an extra `sporting_event_id` column.
+        """
+        pa = _import_pyarrow()
+
+        if sporting_event_id is not None:
+            entry = self._manifest["sportingEvents"].get(sporting_event_id)
+            if entry is None:
+                raise KeyError(
+                    f"Sporting event {sporting_event_id} is not in the store"
+                )
+            return pa.parquet.read_table(
+                self._file_path(sporting_event_id, entry["clockId"]),
+                columns=columns,
+                memory_map=True,
+            )
+
+        import pyarrow.dataset as ds
+        from pyarrow.fs import LocalFileSystem
+
+        files = [
+            str(self._file_path(sporting_event_id, entry["clockId"]))
+            for sporting_event_id, entry in self._manifest["sportingEvents"].items()
+        ]
+        dataset = ds.dataset(
+            files,
+            format="parquet",
+            filesystem=LocalFileSystem(use_mmap=True),
+            partitioning=ds.partitioning(
+                pa.schema([("sporting_event_id", pa.string())]), flavor="hive"
+            ),
+            partition_base_dir=str(self._observations_path),
+        )
+        return dataset.to_table(columns=columns)
+
+    def to_polars(self, sporting_event_id: Optional[str] = None):
+        try:
+            import polars
+        except ImportError:
+            raise ImportError(
+                "polars is required for to_polars(). "
+                "Install it with: pip install polars"
+            )
+
+        return polars.from_arrow(self.read(sporting_event_id))
+
+    def to_pandas(self, sporting_event_id: Optional[str] = None):
+        return self.read(sporting_event_id).to_pandas()
+
+    def get_observation_log(self, sporting_event: SportingEvent) -> ObservationLog:
+        """
+        The stored observation log of `sporting_event`, without requesting it.
+        The log can still be refreshed from the API with `refresh()`.
+        """
+        sporting_event_id = sporting_event.sporting_event_id
+        entry = self._manifest["sportingEvents"].get(sporting_event_id)
+        if entry is None:
+            raise KeyError(f"Sporting event {sporting_event_id} is not in the store")
+
+        table = self.read(sporting_event_id)
+        data = [
+            {
+                "observationId": row["observation_id"],
+                "startTime": row["start_time"],
+                "triggerTime": row["trigger_time"],
+                "endTime": row["end_time"],
+                "code": row["code"],
+                "attributes": json_codec.loads(row["attributes"]),
+                "description": row["description"],
+                "clockId": row["clock_id"],
+            }
+            for row in table.to_pylist()
+        ]
+        return ObservationLog(
+            Observation,
+            sporting_event._requester,
+            "GET",
+            sporting_event._observation_log_url(entry["clockId"]),
+            entry["clockId"],
+            sporting_event,
+            data=data,
+        )
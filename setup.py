@@ -45,8 +45,16 @@ def setup_package():
             "tuspy>=1.0.0",
         ],
         extras_require={
-            "test": ["pytest", "pandas>=1.0.0", "requests-mock==1.10.0", "kloppy"],
-            "cache": ["requests-cache>=0.9.7"],
+            "test": [
+                "pytest",
+                "pandas>=1.0.0",
+                "requests-mock==1.10.0",
+                "kloppy",
+                "aiohttp>=3.8.0",
+            ],
+            "async": ["aiohttp>=3.8.0"],
+            "speedups": ["orjson>=3.0.0"],
+            "columnar": ["numpy>=1.20.0", "pyarrow>=14.0.0"],
             "kloppy": ["kloppy>=3.0.0"],
         },
     )
@@ -1,3 +1,6 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
@@ -31,3 +34,81 @@ def current_team(requester) -> TeamResourceGroup:
             targetResourceName="Soccer Team 1",
         ),
     )
+
+
+class LocalServer:
+    """Threaded HTTP server on localhost for tests that need real concurrency
+    (requests_mock serializes all requests).
+
+    Register handlers with `server.routes[path] = fn(request_handler)`,
+    returning a `(status_code, body)` or `(status_code, body, headers)` tuple.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        self.client_ports = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                with server._lock:
+                    server.requests.append((self.command, self.path))
+                    server.client_ports.add(self.client_address[1])
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    content_length = int(self.headers.get("Content-Length") or 0)
+                    self.body = self.rfile.read(content_length)
+
+                    route = server.routes.get(self.path.split("?")[0])
+                    if route:
+                        status, body, *headers = route(self)
+                    else:
+                        status, body, headers = 404, {"error": "not found"}, []
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+                if not isinstance(body, bytes):
+                    body = json.dumps(body).encode()
+
+                self.send_response(status)
+                for key, value in (headers[0] if headers else {}).items():
+                    self.send_header(key, value)
+                if "Content-Type" not in (headers[0] if headers else {}):
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def local_server():
+    server = LocalServer()
+    server.start()
+    yield server
+    server.stop()
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+import requests
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+
+from pyteamtv.exceptions import InputError
+from pyteamtv.models.observation_log import ObservationLog
+from pyteamtv.models.resource_group.factory import factory
+
+
+SPORTING_EVENTS = [
+    {
+        "type": "training",
+        "name": f"Training {i}",
+        "sportingEventId": f"sporting-event-{i}",
+        "clocks": {},
+        "scheduledAt": "2022-01-01T10:00:00.000Z",
+    }
+    for i in range(5)
+]
+
+
+def observations_for(sporting_event_id: str):
+    return [
+        {
+            "observationId": f"{sporting_event_id}-obs-1",
+            "startTime": 10.0,
+            "triggerTime": 12.0,
+            "endTime": 15.0,
+            "code": "SHOT",
+            "attributes": {},
+            "description": "",
+            "clockId": "U1",
+        }
+    ]
+
+
+async def _run(current_team, fn):
+    state = dict(in_flight=0, max_in_flight=0, headers=[])
+
+    async def sporting_events(request):
+        state["headers"].append(dict(request.headers))
+        return web.json_response(SPORTING_EVENTS)
+
+    async def observations(request):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.05)
+        state["in_flight"] -= 1
+        return web.json_response(
+            observations_for(request.match_info["sporting_event_id"])
+        )
+
+    async def not_found(request):
+        return web.Response(status=404, text="Not here")
+
+    app = web.Application()
+    app.router.add_get("/sportingEvents", sporting_events)
+    app.router.add_get(
+        "/sportingEvents/{sporting_event_id}/observations/{clock_id}", observations
+    )
+    app.router.add_get("/videos/{video_id}", not_found)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    current_team._requester._base_url = f"http://127.0.0.1:{port}"
+    try:
+        async with current_team.aio(max_concurrency=3) as aio_team:
+            return await fn(aio_team), state
+    finally:
+        await runner.cleanup()
+
+
+def test_fetch_observation_logs_concurrently(current_team):
+    async def fn(aio_team):
+        sporting_events = await aio_team.get_sporting_events()
+        return await asyncio.gather(
+            *(aio_team.get_observation_log(se) for se in sporting_events)
+        )
+
+    observation_logs, state = asyncio.run(_run(current_team, fn))
+
+    assert len(observation_logs) == 5
+    for i, observation_log in enumerate(observation_logs):
+        assert isinstance(observation_log, ObservationLog)
+        assert observation_log.sporting_event.sporting_event_id == f"sporting-event-{i}"
+        assert observation_log[0].observation_id == f"sporting-event-{i}-obs-1"
+
+    # Requests overlap, but never more than max_concurrency
+    assert 1 < state["max_in_flight"] <= 3
+
+    headers = state["headers"][0]
+    assert headers["X-Resource-Group-Id"] == "1234-1234-1234"
+    assert headers["Authorization"].startswith("Bearer ")
+
+
+def test_http_error(current_team):
+    async def fn(aio_team):
+        with pytest.raises(requests.HTTPError) as exc_info:
+            await aio_team.get_video("video-1")
+        return exc_info.value
+
+    error, _ = asyncio.run(_run(current_team, fn))
+    assert "404" in str(error)
+    assert "Not here" in str(error)
+    # Like the sync API, the response is available on the exception
+    assert error.response.status_code == 404
+    assert error.response.text == "Not here"
+
+
+def test_unsupported_resource_group(requester):
+    exchange = factory(
+        requester,
+        dict(
+            tenantId="nl_soccer_test",
+            resourceGroupId="1234-1234-1234",
+            targetResourceId="exchange:exchange-1",
+            targetResourceName="Exchange 1",
+        ),
+    )
+    with pytest.raises(InputError, match="TeamResourceGroup"):
+        exchange.aio()
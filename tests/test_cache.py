@@ -0,0 +1,198 @@
+import os
+import time
+
+import pytest
+
+from pyteamtv.exceptions import InputError
+from pyteamtv.infra.cache import HttpCache, create_cache
+from pyteamtv.infra.cache_backends import (
+    CacheBackend,
+    CacheEntry,
+    MemoryBackend,
+    SQLiteBackend,
+)
+from pyteamtv.infra.requester import Requester
+
+
+PERSONS = [
+    {
+        "personId": "person-1",
+        "firstName": "John",
+        "lastName": "Doe",
+        "gender": "male",
+    }
+]
+
+
+@pytest.fixture
+def cached_requester():
+    return Requester(
+        "https://fake-url",
+        "token",
+        cache=HttpCache(ttls={"/persons": 3600, "/sportingEvents*": 0}),
+    )
+
+
+def test_fresh_responses_are_served_from_cache(cached_requester, requests_mock):
+    adapter = requests_mock.get("https://fake-url/persons", json=PERSONS)
+
+    assert cached_requester.request("GET", "/persons") == PERSONS
+    assert cached_requester.request("GET", "/persons") == PERSONS
+    assert adapter.call_count == 1
+
+    # Another resource group has its own entries
+    other = cached_requester.with_extra_headers({"X-Resource-Group-Id": "1"})
+    assert other.request("GET", "/persons") == PERSONS
+    assert adapter.call_count == 2
+
+
+def test_expired_responses_are_revalidated(cached_requester, requests_mock):
+    adapter = requests_mock.get(
+        "https://fake-url/sportingEvents",
+        [
+            dict(json=[{"id": 1}], headers={"ETag": '"v1"'}),
+            dict(status_code=304, headers={"ETag": '"v1"'}),
+            dict(json=[{"id": 1}, {"id": 2}], headers={"ETag": '"v2"'}),
+        ],
+    )
+
+    assert cached_requester.request("GET", "/sportingEvents") == [{"id": 1}]
+    assert "If-None-Match" not in adapter.last_request.headers
+
+    assert cached_requester.request("GET", "/sportingEvents") == [{"id": 1}]
+    assert adapter.last_request.headers["If-None-Match"] == '"v1"'
+
+    assert cached_requester.request("GET", "/sportingEvents") == [
+        {"id": 1},
+        {"id": 2},
+    ]
+    assert adapter.call_count == 3
+
+
+def test_writes_invalidate_collection(cached_requester, requests_mock):
+    adapter = requests_mock.get("https://fake-url/persons", json=PERSONS)
+    requests_mock.post("https://fake-url/persons", json=PERSONS[0])
+
+    cached_requester.request("GET", "/persons")
+    cached_requester.request("POST", "/persons", {"firstName": "John"})
+    cached_requester.request("GET", "/persons")
+
+    assert adapter.call_count == 2
+
+
+def test_no_store(cached_requester, requests_mock):
+    adapter = requests_mock.get(
+        "https://fake-url/persons", json=PERSONS, headers={"Cache-Control": "no-store"}
+    )
+
+    cached_requester.request("GET", "/persons")
+    cached_requester.request("GET", "/persons")
+
+    assert adapter.call_count == 2
+
+
+def _entry(size: int) -> CacheEntry:
+    return CacheEntry(
+        content=b"x" * size, etag=None, last_modified=None, expires_at=time.time() + 60
+    )
+
+
+@pytest.mark.parametrize(
+    "make_backend",
+    [
+        lambda tmp_path: MemoryBackend(max_bytes=250),
+        lambda tmp_path: SQLiteBackend(tmp_path / "cache.sqlite", max_bytes=250),
+    ],
+    ids=["memory", "sqlite"],
+)
+def test_backend_lru_eviction(make_backend, tmp_path):
+    backend = make_backend(tmp_path)
+
+    backend.set("a", _entry(100))
+    backend.set("b", _entry(100))
+    # Touch "a", so "b" is the least recently used
+    time.sleep(0.01)
+    assert backend.get("a").size == 100
+
+    backend.set("c", _entry(100))
+
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.get("c") is not None
+    assert backend.stats.evictions == 1
+
+    # Too big to store at all
+    backend.set("d", _entry(1000))
+    assert backend.get("d") is None
+
+
+@pytest.mark.parametrize(
+    "make_backend",
+    [
+        lambda tmp_path: MemoryBackend(),
+        lambda tmp_path: SQLiteBackend(tmp_path / "cache.sqlite"),
+    ],
+    ids=["memory", "sqlite"],
+)
+def test_backend_delete_collection(make_backend, tmp_path):
+    backend = make_backend(tmp_path)
+
+    for path in ("/teams", "/teams/1/players", "/teams?x=1", "/teamsX", "/persons"):
+        backend.set(f"prefix|{path}", _entry(10))
+
+    backend.delete_collection("/teams")
+
+    assert sorted(backend.keys()) == ["prefix|/persons", "prefix|/teamsX"]
+
+
+def test_incomplete_backend():
+    class DictBackend(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        DictBackend()
+
+
+def test_sqlite_backend_persists(tmp_path, requests_mock):
+    adapter = requests_mock.get("https://fake-url/persons", json=PERSONS)
+
+    for _ in range(2):
+        requester = Requester(
+            "https://fake-url",
+            "token",
+            use_cache=SQLiteBackend(tmp_path / "cache.sqlite"),
+        )
+        assert requester.request("GET", "/persons") == PERSONS
+
+    assert adapter.call_count == 1
+    assert requester.cache.stats.hits == 1
+
+
+def test_cache_stats(cached_requester, requests_mock):
+    requests_mock.get("https://fake-url/persons", json=PERSONS)
+
+    for _ in range(3):
+        cached_requester.request("GET", "/persons")
+
+    assert cached_requester.cache.stats.as_dict() == {
+        "hits": 2,
+        "misses": 1,
+        "revalidations": 0,
+        "evictions": 0,
+    }
+
+
+def test_create_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEAMTV_CACHE_DIR", str(tmp_path))
+
+    assert create_cache(False) is None
+    assert isinstance(create_cache(True).backend, MemoryBackend)
+    assert isinstance(create_cache("sqlite").backend, SQLiteBackend)
+    assert (tmp_path / "http_cache.sqlite").exists()
+    if hasattr(os, "getuid"):
+        assert tmp_path.stat().st_mode & 0o777 == 0o700
+        assert (tmp_path / "http_cache.sqlite").stat().st_mode & 0o777 == 0o600
+
+    with pytest.raises(InputError):
+        create_cache("redis")
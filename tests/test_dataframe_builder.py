@@ -1,3 +1,5 @@
+import pytest
+
 from pyteamtv.dataframe_builder import DataframeBuilder
 from pyteamtv.models.observation import Observation
 from pyteamtv.models.observation_log import ObservationLog
@@ -116,3 +118,229 @@ def test_build_records_with_dynamic_person_ids(requester, current_team, requests
     assert "personId" not in shot_record
     assert "assistPersonId" not in shot_record
     assert "keeperPersonId" not in shot_record
+
+
+def test_build_table_matches_build_records(requester, current_team, requests_mock):
+    pytest.importorskip("pyarrow")
+
+    requests_mock.get(
+        "https://fake-url/teams",
+        json=[{"teamId": "team-1", "name": "Team A"}],
+    )
+    requests_mock.get(
+        "https://fake-url/persons",
+        json=[
+            {
+                "personId": "person-1",
+                "firstName": "John",
+                "lastName": "Doe",
+                "number": 10,
+                "gender": "male",
+            }
+        ],
+    )
+    builder = DataframeBuilder(current_team)
+
+    sporting_event = SportingEvent(
+        requester,
+        {
+            "sportingEventId": "event-1",
+            "type": "match",
+            "name": "Team A - Team B",
+            "scheduledAt": "2025-01-01T10:00:00Z",
+            "homeTeamId": "team-1",
+            "awayTeamId": "team-2",
+            "lineUpId": "lineup-1",
+            "clocks": {},
+        },
+    )
+
+    def observation(i, code, attributes):
+        return {
+            "observationId": f"obs-{i}",
+            "code": code,
+            "startTime": float(i),
+            "triggerTime": float(i),
+            "endTime": float(i) + 1,
+            "clockId": "U1",
+            "description": "",
+            "attributes": attributes,
+        }
+
+    observation_log = ObservationLog(
+        Observation,
+        requester,
+        "GET",
+        "/observations",
+        "U1",
+        sporting_event,
+        data=[
+            observation(0, "POSSESSION", {"teamId": "team-1", "position": "ATTACK:1"}),
+            observation(
+                1,
+                "SHOT",
+                {"personId": "person-1", "angle": 135, "distance": 5.0},
+            ),
+            observation(2, "POSSESSION", {"teamId": "team-2", "position": None}),
+            observation(3, "REBOUND", {"result": "WON", "position": "DEFENCE:2"}),
+            observation(4, "SHOT", {"angle": 45, "distance": 2.5}),
+        ],
+    )
+
+    records = builder.build_records([observation_log])
+    table = builder.build_table([observation_log])
+
+    assert table.num_rows == len(records)
+    assert set(table.column_names) == set().union(*records)
+    for name in table.column_names:
+        column = table[name].to_pylist()
+        for i, record in enumerate(records):
+            if isinstance(column[i], float):
+                assert column[i] == pytest.approx(record[name])
+            else:
+                assert column[i] == record.get(name)
+
+    assert table["position"].to_pylist() == ["ATTACK", "ATTACK", None, "DEFENCE", None]
+    assert table["x"].to_pylist()[0] is None
+
+
+def test_write_parquet(requester, current_team, requests_mock, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    requests_mock.get("https://fake-url/teams", json=[])
+    requests_mock.get("https://fake-url/persons", json=[])
+    builder = DataframeBuilder(current_team)
+
+    def observation_log(i, attributes_list):
+        sporting_event = SportingEvent(
+            requester,
+            {
+                "sportingEventId": f"event-{i}",
+                "type": "training",
+                "name": f"Training {i}",
+                "scheduledAt": "2025-01-01T10:00:00Z",
+                "clocks": {},
+            },
+        )
+        return ObservationLog(
+            Observation,
+            requester,
+            "GET",
+            "/observations",
+            "U1",
+            sporting_event,
+            data=[
+                {
+                    "observationId": f"obs-{i}-{j}",
+                    "code": "SHOT",
+                    "startTime": float(j),
+                    "triggerTime": float(j),
+                    "endTime": float(j) + 1,
+                    "clockId": "U1",
+                    "description": "",
+                    "attributes": attributes,
+                }
+                for j, attributes in enumerate(attributes_list)
+            ],
+        )
+
+    def observation_logs():
+        yield observation_log(0, [{"result": "MISS"}] * 3)
+        # A column that shows up later, and one that changes type
+        yield observation_log(1, [{"result": 1, "rating": 5}] * 4)
+
+    batches = list(builder.iter_batches(observation_logs()))
+    assert [batch.num_rows for batch in batches] == [3, 4]
+
+    batches = list(builder.iter_batches(observation_logs(), batch_size=2))
+    assert [batch.num_rows for batch in batches] == [2, 2, 2, 1]
+    assert batches[1]["observation_id"].to_pylist() == ["obs-0-2", "obs-1-0"]
+
+    path = tmp_path / "observations.parquet"
+    assert builder.write_parquet(observation_logs(), path, batch_size=2) == 7
+    assert [p.name for p in tmp_path.iterdir()] == ["observations.parquet"]
+
+    table = pq.read_table(path)
+    assert table["observation_id"].to_pylist() == [
+        f"obs-{i}-{j}" for i, count in enumerate([3, 4]) for j in range(count)
+    ]
+    assert table["result"].to_pylist() == ["MISS"] * 3 + ["1"] * 4
+    assert table["rating"].to_pylist() == [None] * 3 + [5] * 4
+
+    def mixed_observation_logs():
+        # An attribute that is a string in one log and an object in another,
+        # and of mixed types within one log
+        yield observation_log(0, [{"zone": "A", "extra": 1}])
+        yield observation_log(1, [{"zone": {"x": 1}, "extra": True}])
+        yield observation_log(2, [{"zone": "B", "extra": [1, 2]}, {"extra": "C"}])
+
+    assert builder.write_parquet(mixed_observation_logs(), path, batch_size=1) == 4
+    table = pq.read_table(path)
+    assert table["zone"].to_pylist() == ["A", '{"x": 1}', "B", None]
+    assert table["extra"].to_pylist() == ["1", "true", "[1, 2]", "C"]
+
+
+def test_build_df_workers(requester, current_team, requests_mock):
+    requests_mock.get("https://fake-url/teams", json=[])
+    requests_mock.get(
+        "https://fake-url/persons",
+        json=[
+            {
+                "personId": "person-1",
+                "firstName": "John",
+                "lastName": "Doe",
+                "number": 10,
+                "gender": "male",
+            }
+        ],
+    )
+    builder = DataframeBuilder(current_team)
+
+    observation_logs = []
+    for i in range(5):
+        sporting_event = SportingEvent(
+            requester,
+            {
+                "sportingEventId": f"event-{i}",
+                "type": "match",
+                "name": "Team A - Team B",
+                "scheduledAt": "2025-01-01T10:00:00Z",
+                "homeTeamId": "team-1",
+                "awayTeamId": "team-2",
+                "lineUpId": "lineup-1",
+                "clocks": {},
+            },
+        )
+        observation_logs.append(
+            ObservationLog(
+                Observation,
+                requester,
+                "GET",
+                "/observations",
+                "U1",
+                sporting_event,
+                data=[
+                    {
+                        "observationId": f"obs-{i}-{j}",
+                        "code": "POSSESSION" if j % 3 == 0 else "SHOT",
+                        "startTime": float(j),
+                        "triggerTime": float(j),
+                        "endTime": float(j) + 1,
+                        "clockId": "U1",
+                        "description": "",
+                        "attributes": (
+                            {"teamId": f"team-{j % 2 + 1}"}
+                            if j % 3 == 0
+                            else {"personId": "person-1", "result": "GOAL"}
+                        ),
+                    }
+                    for j in range(10)
+                ],
+            )
+        )
+
+    expected = builder.build_df(observation_logs)
+    df = builder.build_df(observation_logs, workers=2)
+
+    assert len(df) == 50
+    assert df.to_dict("records") == expected.to_dict("records")
@@ -0,0 +1,49 @@
+from pyteamtv.models.sporting_event import SportingEvent
+
+
+def test_fetch_observation_logs(requester, current_team, requests_mock):
+    sporting_events = [
+        SportingEvent(
+            requester,
+            {
+                "type": "training",
+                "name": f"Training {i}",
+                "sportingEventId": f"sporting-event-{i}",
+                "clocks": {},
+                "scheduledAt": "2022-01-01T10:00:00.000Z",
+            },
+        )
+        for i in range(10)
+    ]
+
+    for i in range(10):
+        if i == 3:
+            requests_mock.get(
+                f"https://fake-url/sportingEvents/sporting-event-{i}/observations/U1",
+                status_code=404,
+            )
+        else:
+            requests_mock.get(
+                f"https://fake-url/sportingEvents/sporting-event-{i}/observations/U1",
+                json=[
+                    {
+                        "observationId": f"obs-{i}",
+                        "startTime": 10.0,
+                        "triggerTime": 12.0,
+                        "endTime": 15.0,
+                        "code": "SHOT",
+                        "attributes": {},
+                        "description": "",
+                        "clockId": "U1",
+                    }
+                ],
+            )
+
+    batch = current_team.fetch_observation_logs(sporting_events, max_workers=4)
+
+    assert len(batch) == 9
+    assert [log[0].observation_id for log in batch] == [
+        f"obs-{i}" for i in range(10) if i != 3
+    ]
+    assert list(batch.failures.keys()) == ["sporting-event-3"]
+    assert "404" in str(batch.failures["sporting-event-3"])
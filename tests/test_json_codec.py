@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from pyteamtv.exceptions import InputError
+from pyteamtv.infra import json_codec
+
+
+def _installed_codecs():
+    names = []
+    for name in json_codec.CODECS:
+        try:
+            json_codec.get_codec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+@pytest.mark.parametrize("name", _installed_codecs())
+def test_codec_roundtrip(name):
+    _, (loads, dumps) = json_codec.get_codec(name)
+
+    data = {
+        "observations": [
+            {"code": "SHOT", "startTime": 1.5, "attributes": {"result": "GOAL"}},
+            {"code": "PASS", "startTime": 10, "description": "Jöhn ⚽"},
+        ],
+        "count": 2,
+        "empty": None,
+    }
+    encoded = dumps(data)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == data
+    assert loads(encoded) == data
+
+    with pytest.raises(ValueError):
+        loads(b"not json")
+
+
+@pytest.mark.parametrize("name", _installed_codecs())
+def test_codec_rejects_non_finite_floats(name):
+    _, (_, dumps) = json_codec.get_codec(name)
+
+    for value in (float("nan"), float("inf"), -float("inf")):
+        with pytest.raises(ValueError):
+            dumps({"observations": [{"startTime": value}]})
+
+
+def test_unknown_codec(monkeypatch):
+    with pytest.raises(InputError):
+        json_codec.get_codec("ujson")
+
+    # A typo in the environment falls back to the json module
+    monkeypatch.setenv("TEAMTV_JSON_CODEC", "ujson")
+    name, _ = json_codec._codec_from_env()
+    assert name == "json"
+
+
+def test_request_body_encoding(requester, requests_mock):
+    adapter = requests_mock.post("https://fake-url/persons", json={"personId": "1"})
+
+    assert requester.request("POST", "/persons", {"firstName": "John"}) == {
+        "personId": "1"
+    }
+    assert adapter.last_request.headers["Content-Type"] == "application/json"
+    assert adapter.last_request.json() == {"firstName": "John"}
@@ -0,0 +1,111 @@
+import time
+
+import pytest
+
+from pyteamtv.exceptions import InputError
+
+from pyteamtv.infra.requester import Requester
+from pyteamtv.models.list import List, prefetch_all
+from pyteamtv.models.person import Person
+
+
+PERSONS = [
+    {
+        "personId": f"person-{i}",
+        "firstName": "John",
+        "lastName": f"Doe {i}",
+        "gender": "male",
+    }
+    for i in range(3)
+]
+
+
+def test_list_is_lazy(requester, requests_mock):
+    adapter = requests_mock.get("https://fake-url/persons", json=PERSONS)
+
+    persons = List(Person, requester, "GET", "/persons")
+    assert adapter.call_count == 0
+    assert not persons.is_loaded
+
+    assert persons
+    assert persons[1].person_id == "person-1"
+    assert [person.person_id for person in persons] == [
+        "person-0",
+        "person-1",
+        "person-2",
+    ]
+    assert adapter.call_count == 1
+
+
+def test_prefetch(requester, requests_mock):
+    adapter = requests_mock.get("https://fake-url/persons", json=PERSONS)
+
+    persons = List(Person, requester, "GET", "/persons").prefetch()
+    assert adapter.call_count == 1
+    assert persons.is_loaded
+
+    # Lists built from data never request
+    persons = List(Person, requester, "GET", "/persons", data=PERSONS)
+    assert persons.is_loaded
+    assert persons[0].person_id == "person-0"
+    assert adapter.call_count == 1
+
+
+def test_prefetch_all(local_server):
+    def persons(request):
+        time.sleep(0.05)
+        return 200, PERSONS
+
+    for i in range(4):
+        local_server.routes[f"/persons/{i}"] = persons
+
+    requester = Requester(local_server.url, "token")
+    lists = [List(Person, requester, "GET", f"/persons/{i}") for i in range(4)]
+
+    assert prefetch_all(lists) == lists
+    assert all(list_.is_loaded for list_ in lists)
+    assert local_server.max_in_flight > 1
+    assert len(local_server.requests) == 4
+
+    # Already loaded lists aren't fetched again
+    prefetch_all(lists)
+    assert len(local_server.requests) == 4
+
+
+def test_indexes(requester):
+    data = PERSONS + [dict(PERSONS[0], personId="person-3")]
+    persons = List(Person, requester, "GET", "/persons", data=data)
+
+    assert persons.get_by_id("person-1").last_name == "Doe 1"
+    assert persons.get_by_id("unknown") is None
+
+    by_last_name = persons.index_by("last_name")
+    # First one wins
+    assert by_last_name["Doe 0"].person_id == "person-0"
+    # Cached
+    assert persons.index_by("last_name") is by_last_name
+
+    groups = persons.group_by(lambda person: person.last_name)
+    assert [person.person_id for person in groups["Doe 0"]] == [
+        "person-0",
+        "person-3",
+    ]
+    assert len(groups["Doe 2"]) == 1
+
+    # Indexes by function aren't cached
+    persons.group_by(lambda person: person.last_name)
+    assert len(persons._indexes) == 2
+
+
+def test_get_by_id_with_factory(requester):
+    def factory(requester_, data):
+        return Person(requester_, data)
+
+    persons = List(factory, requester, "GET", "/persons", data=PERSONS)
+    with pytest.raises(InputError):
+        persons.get_by_id("person-1")
+
+    persons = List(
+        factory, requester, "GET", "/persons", data=PERSONS, id_attribute="person_id"
+    )
+    assert persons.get_by_id("person-1").last_name == "Doe 1"
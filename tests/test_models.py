@@ -0,0 +1,156 @@
+import pickle
+
+from pyteamtv.infra.identity_map import IdentityMap
+from pyteamtv.infra.requester import Requester
+from pyteamtv.models.observation import Observation
+from pyteamtv.models.person import Person
+from pyteamtv.models.sporting_event import MatchSportingEvent, SportingEvent
+from pyteamtv.models.video import Video
+
+
+OBSERVATION = {
+    "observationId": "obs-1",
+    "startTime": 10.0,
+    "triggerTime": 12.0,
+    "endTime": 15.0,
+    "code": "SHOT",
+    "attributes": {"result": "GOAL"},
+    "description": "",
+    "clockId": "U1",
+}
+
+
+def test_compact_models(requester):
+    observation = Observation(requester, OBSERVATION)
+    other = Observation(requester, dict(OBSERVATION, code="".join(["SH", "OT"])))
+
+    assert not hasattr(observation, "__dict__")
+    assert observation.raw_attributes is OBSERVATION
+    # Codes are interned
+    assert observation.code is other.code
+
+    copy = pickle.loads(pickle.dumps(observation))
+    assert copy.observation_id == "obs-1"
+    assert copy.attributes == {"result": "GOAL"}
+
+    for class_ in (Video, Person, SportingEvent, MatchSportingEvent):
+        assert "__dict__" not in dir(class_)
+
+
+def test_drop_raw_attributes(requester, monkeypatch):
+    monkeypatch.setattr(Observation, "keep_raw_attributes", False)
+
+    observation = Observation(requester, OBSERVATION)
+
+    assert observation.raw_attributes is None
+    assert observation.code == "SHOT"
+    assert observation.metadata == {}
+
+
+def test_lazy_attribute_parsing(requester):
+    sporting_event = SportingEvent(
+        requester,
+        {
+            "type": "training",
+            "name": "Training",
+            "sportingEventId": "sporting-event-1",
+            "clocks": {
+                "video-1": {
+                    "clockId": "U1",
+                    "synchronizationPoints": [
+                        {"type": "START", "key": "1", "time": "2022-01-01T10:00:00Z"}
+                    ],
+                }
+            },
+            "scheduledAt": "2022-01-01T10:00:00.000Z",
+            "_metadata": {
+                "source": {
+                    "type": "SharedResourceGroup",
+                    "share": {
+                        "resourceGroup": {
+                            "targetResourceName": "Club",
+                            "resourceGroupId": "rg-1",
+                            "tenantId": "tenant-1",
+                        }
+                    },
+                }
+            },
+        },
+    )
+    assert sporting_event._scheduled_at is None
+
+    scheduled_at = sporting_event.scheduled_at
+    assert scheduled_at.isoformat() == "2022-01-01T10:00:00+00:00"
+    assert sporting_event.scheduled_at is scheduled_at
+    assert str(sporting_event) == "01/01/22 Training"
+
+    assert not sporting_event.is_local
+    assert sporting_event.shared_resource_group == {
+        "name": "Club",
+        "id": "rg-1",
+        "tenant_id": "tenant-1",
+    }
+
+    clock = sporting_event.get_clock("video-1")
+    assert clock._synchronization_points is None
+    assert clock.synchronization_points[0]["time"] == scheduled_at
+
+
+def test_identity_map(requests_mock):
+    requester = Requester("https://fake-url", "token", identity_map=IdentityMap())
+    sporting_event = SportingEvent(
+        requester,
+        {
+            "type": "match",
+            "name": "Home - Away",
+            "sportingEventId": "sporting-event-1",
+            "clocks": {},
+            "scheduledAt": "2022-01-01T10:00:00.000Z",
+            "lineUpId": "line-up-1",
+            "homeTeamId": "team-1",
+            "awayTeamId": "team-2",
+        },
+    )
+    adapter = requests_mock.get(
+        "https://fake-url/teams/team-1",
+        [
+            dict(json={"teamId": "team-1", "name": "Home"}),
+            dict(json={"teamId": "team-1", "name": "Home renamed"}),
+        ],
+    )
+    derived = requester.with_extra_headers({"X-Resource-Group-Id": "1"})
+
+    team = sporting_event.get_home_team()
+    assert sporting_event.get_home_team() is team
+    assert derived.identity_map is requester.identity_map
+    assert adapter.call_count == 1
+
+    # Refresh updates the existing instance
+    assert sporting_event.get_home_team(refresh=True) is team
+    assert team.name == "Home renamed"
+    assert adapter.call_count == 2
+
+    requester.identity_map.invalidate(type(team), "team-1")
+    assert sporting_event.get_home_team() is not team
+    assert adapter.call_count == 3
+
+    # Objects aren't stored in a session
+    assert len(pickle.loads(pickle.dumps(requester.identity_map))) == 0
+
+
+def test_identity_map_is_per_resource_group(requests_mock):
+    requester = Requester("https://fake-url", "token", identity_map=IdentityMap())
+    group_a = requester.with_extra_headers({"X-Resource-Group-Id": "a"})
+    group_b = requester.with_extra_headers({"X-Resource-Group-Id": "b"})
+    requests_mock.get(
+        "https://fake-url/videos/video-1",
+        json={"videoId": "video-1", "state": "new", "tags": {}, "parts": []},
+    )
+
+    video_a = Video._fetch(group_a, "video-1", "/videos/video-1")
+    video_b = Video._fetch(group_b, "video-1", "/videos/video-1")
+
+    assert video_a is not video_b
+    assert video_b._requester is group_b
+    assert Video._fetch(group_b, "video-1", "/videos/video-1") is video_b
+    assert requests_mock.call_count == 2
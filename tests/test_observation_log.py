@@ -0,0 +1,223 @@
+import random
+
+import pytest
+
+from pyteamtv.models.interval_index import IntervalIndex
+from pyteamtv.models.observation import Observation
+from pyteamtv.models.observation_log import ObservationLog
+from pyteamtv.models.sporting_event import SportingEvent
+
+
+def _observation(i: int, code: str, start_time: float, end_time: float) -> dict:
+    return {
+        "observationId": f"obs-{i}",
+        "startTime": start_time,
+        "triggerTime": end_time,
+        "endTime": end_time,
+        "code": code,
+        "attributes": {},
+        "description": "",
+        "clockId": "U1",
+    }
+
+
+OBSERVATIONS = [
+    _observation(0, "POSSESSION", 0.0, 30.0),
+    _observation(1, "SHOT", 10.0, 12.0),
+    _observation(2, "PASS", 5.0, 6.0),
+    _observation(3, "SHOT", 25.0, 26.0),
+    _observation(4, "POSSESSION", 30.0, 60.0),
+    _observation(5, "SHOT", 40.0, 41.0),
+]
+
+
+@pytest.fixture
+def observation_log(requester):
+    sporting_event = SportingEvent(
+        requester,
+        {
+            "type": "training",
+            "name": "Training",
+            "sportingEventId": "sporting-event-1",
+            "clocks": {},
+            "scheduledAt": "2022-01-01T10:00:00.000Z",
+        },
+    )
+    return ObservationLog(
+        Observation,
+        requester,
+        "GET",
+        "/sportingEvents/sporting-event-1/observations/U1",
+        "U1",
+        sporting_event,
+        data=OBSERVATIONS,
+    )
+
+
+def _ids(observations) -> list:
+    return [observation.observation_id for observation in observations]
+
+
+def test_columns(observation_log):
+    columns = observation_log.columns
+    assert observation_log.columns is columns
+    assert len(columns) == 6
+
+    shots = columns.filter(columns["code"] == "SHOT")
+    assert _ids(shots.sort_by("trigger_time", descending=True).observations()) == [
+        "obs-5",
+        "obs-3",
+        "obs-1",
+    ]
+    assert shots.observations()[0] is observation_log[1]
+
+    assert _ids(columns.sort_by("start_time").observations()) == [
+        "obs-0",
+        "obs-2",
+        "obs-1",
+        "obs-3",
+        "obs-4",
+        "obs-5",
+    ]
+    assert _ids(columns.between("start_time", 5, 25).observations()) == [
+        "obs-1",
+        "obs-2",
+        "obs-3",
+    ]
+
+    groups = columns.group_by("code")
+    assert list(groups) == ["PASS", "POSSESSION", "SHOT"]
+    assert _ids(groups["POSSESSION"].observations()) == ["obs-0", "obs-4"]
+    assert columns.count_by("code") == {"PASS": 1, "POSSESSION": 2, "SHOT": 3}
+
+
+def test_export(observation_log):
+    df = observation_log.to_pandas()
+    assert list(df["observation_id"]) == _ids(observation_log)
+    assert df["code"].dtype == "category"
+
+    pa = pytest.importorskip("pyarrow")
+    table = observation_log.to_arrow()
+    assert table.num_rows == 6
+    assert pa.types.is_dictionary(table.schema.field("code").type)
+    assert table.column("start_time").to_pylist() == [
+        observation.start_time for observation in observation_log
+    ]
+
+    pytest.importorskip("polars")
+    assert observation_log.to_polars().shape == (6, 6)
+
+
+def test_interval_queries(observation_log):
+    assert _ids(observation_log.overlapping(11, 26)) == [
+        "obs-0",
+        "obs-1",
+        "obs-3",
+    ]
+    assert _ids(observation_log.between(0, 30)) == [
+        "obs-0",
+        "obs-2",
+        "obs-1",
+        "obs-3",
+    ]
+    assert _ids(observation_log.nearest(35)) == ["obs-4"]
+    assert _ids(observation_log.nearest(7.5, count=3)) == ["obs-0", "obs-2", "obs-1"]
+    # Everything within 3 seconds of obs-5 (40-41)
+    assert _ids(observation_log.nearest(40, count=None, max_distance=3)) == [
+        "obs-4",
+        "obs-5",
+    ]
+
+
+def test_interval_index_matches_scan():
+    class Item:
+        def __init__(self, start_time, end_time):
+            self.start_time = start_time
+            self.end_time = end_time
+
+    rng = random.Random(42)
+    items = []
+    for _ in range(500):
+        start = rng.uniform(0, 1000)
+        items.append(Item(start, start + rng.expovariate(1 / 20)))
+    index = IntervalIndex(items)
+
+    for _ in range(200):
+        t0 = rng.uniform(-50, 1050)
+        t1 = t0 + rng.uniform(0, 100)
+        assert set(map(id, index.overlapping(t0, t1))) == {
+            id(item) for item in items if item.start_time <= t1 and item.end_time >= t0
+        }
+        assert set(map(id, index.between(t0, t1))) == {
+            id(item) for item in items if item.start_time >= t0 and item.end_time <= t1
+        }
+
+        def distance(item):
+            return max(item.start_time - t0, t0 - item.end_time, 0)
+
+        nearest = index.nearest(t0, count=5)
+        assert [distance(item) for item in nearest] == sorted(
+            distance(item) for item in items
+        )[:5]
+
+
+@pytest.mark.parametrize("keep_raw_attributes", [True, False])
+def test_refresh(requester, requests_mock, monkeypatch, keep_raw_attributes):
+    monkeypatch.setattr(Observation, "keep_raw_attributes", keep_raw_attributes)
+    sporting_event = SportingEvent(
+        requester,
+        {
+            "type": "training",
+            "name": "Training",
+            "sportingEventId": "sporting-event-1",
+            "clocks": {},
+            "scheduledAt": "2022-01-01T10:00:00.000Z",
+        },
+    )
+    changed = dict(OBSERVATIONS[1], description="Great shot")
+    added = _observation(6, "SHOT", 50.0, 51.0)
+    requests_mock.get(
+        "https://fake-url/sportingEvents/sporting-event-1/observations/U1",
+        [
+            dict(json=OBSERVATIONS),
+            dict(json=OBSERVATIONS),
+            dict(json=[OBSERVATIONS[0], changed] + OBSERVATIONS[3:] + [added]),
+        ],
+    )
+
+    observation_log = sporting_event.get_observation_log()
+    observations = list(observation_log)
+    columns = observation_log.columns
+
+    assert not observation_log.refresh()
+    assert observation_log.columns is columns
+
+    changes = observation_log.refresh()
+    assert _ids(changes.added) == ["obs-6"]
+    assert _ids(changes.changed) == ["obs-1"]
+    assert _ids(changes.removed) == ["obs-2"]
+
+    # Unchanged and changed observations are the same objects
+    assert observation_log[0] is observations[0]
+    assert observation_log[1] is observations[1]
+    assert observations[1].description == "Great shot"
+    assert _ids(observation_log) == [
+        "obs-0",
+        "obs-1",
+        "obs-3",
+        "obs-4",
+        "obs-5",
+        "obs-6",
+    ]
+    assert len(observation_log.columns) == 6
+
+
+def test_pickle(observation_log):
+    import pickle
+
+    restored = pickle.loads(pickle.dumps(observation_log))
+
+    assert restored.is_loaded
+    assert [observation.raw_attributes for observation in restored] == OBSERVATIONS
+    assert restored.sporting_event.sporting_event_id == "sporting-event-1"
+    assert restored.get_mapping_stats() == dict(success=6, failed=0)
@@ -0,0 +1,75 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyteamtv.infra.rate_limiter import RateLimiter
+from pyteamtv.infra.requester import Requester
+
+
+def test_token_bucket(monkeypatch):
+    # Freeze the clock so the test doesn't depend on how fast it runs
+    monkeypatch.setattr(time, "monotonic", lambda: 1000.0)
+    limiter = RateLimiter(requests_per_second=10, burst=2)
+
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    # Bucket is empty: callers queue up 1/10s behind each other
+    assert limiter.reserve() == pytest.approx(0.1)
+    assert limiter.reserve() == pytest.approx(0.2)
+
+
+def test_unlimited():
+    limiter = RateLimiter()
+    assert all(limiter.reserve() == 0 for _ in range(100))
+
+
+def test_limits_shared_by_derived_requesters(local_server):
+    def videos(request):
+        time.sleep(0.02)
+        return 200, []
+
+    for i in range(40):
+        local_server.routes[f"/videos/{i}"] = videos
+
+    requester = Requester(
+        local_server.url,
+        "token",
+        rate_limiter=RateLimiter(requests_per_second=200, max_in_flight=2),
+    )
+    requesters = [
+        requester.with_extra_headers({"X-Resource-Group-Id": str(i)}) for i in range(4)
+    ]
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(
+                lambda i: requesters[i % 4].request("GET", f"/videos/{i}"), range(40)
+            )
+        )
+    took = time.time() - start
+
+    assert local_server.max_in_flight == 2
+    # 40 requests, at most 2 in flight of 20ms each
+    assert took >= 0.4
+
+
+def test_requests_per_second(local_server):
+    for i in range(11):
+        local_server.routes[f"/videos/{i}"] = lambda request: (200, [])
+
+    requester = Requester(
+        local_server.url,
+        "token",
+        rate_limiter=RateLimiter(requests_per_second=50, burst=1),
+    )
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(lambda i: requester.request("GET", f"/videos/{i}"), range(11))
+        )
+    took = time.time() - start
+
+    assert took >= 0.2
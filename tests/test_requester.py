@@ -1,6 +1,16 @@
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import requests
 
+from pyteamtv.api.endpoint import API_ENDPOINT
+from pyteamtv.api.user import TeamTVUser
+from pyteamtv.infra.requester import Requester
+from pyteamtv.infra.retry import RetryPolicy
+from pyteamtv.infra.session import DEFAULT_MAX_WORKERS, DEFAULT_POOL_MAXSIZE
+
 
 def test_http_error_includes_request_and_response_details(requests_mock, requester):
     """Test that HTTP errors include request body and response content"""
@@ -19,3 +29,200 @@ def test_http_error_includes_request_and_response_details(requests_mock, request
     assert "https://fake-url/endpoint" in error_message
     assert str(request_body) in error_message
     assert "Invalid request data" in error_message
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("pyteamtv.infra.requester.time.sleep", sleeps.append)
+    return sleeps
+
+
+def test_retry_transient_errors(requests_mock, requester, sleeps):
+    requests_mock.get(
+        "https://fake-url/sportingEvents/a0c2e6b4-1d1c-11ee-be56-0242ac120002",
+        [
+            dict(status_code=503),
+            dict(status_code=429, headers={"Retry-After": "7"}),
+            dict(json={"ok": True}),
+        ],
+    )
+
+    derived = requester.with_extra_headers({"X-Resource-Group-Id": "123"})
+    assert derived.request(
+        "GET", "/sportingEvents/a0c2e6b4-1d1c-11ee-be56-0242ac120002"
+    ) == {"ok": True}
+
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.5
+    assert sleeps[1] == 7
+
+    # Stats are shared with the requester it's derived from
+    assert requester.retry_stats.as_dict() == {"GET /sportingEvents/{id}": 2}
+
+
+def test_client_retry_stats(requests_mock, requester, sleeps):
+    requests_mock.get(
+        f"{API_ENDPOINT}/api/users/me/services",
+        [dict(status_code=503), dict(json={})],
+    )
+
+    user = TeamTVUser(requester.jwt_token)
+    assert user.cache is None
+    user.get_services()
+    assert user.retry_stats.total == 1
+
+
+def test_retry_non_idempotent_methods_only_on_429(requests_mock, requester, sleeps):
+    adapter = requests_mock.post(
+        "https://fake-url/endpoint",
+        [dict(status_code=429), dict(status_code=500), dict(json={})],
+    )
+
+    with pytest.raises(requests.HTTPError):
+        requester.request("POST", "/endpoint", input_={})
+
+    assert adapter.call_count == 2
+    assert len(sleeps) == 1
+
+
+def test_retry_gives_up(requests_mock, requester, sleeps):
+    adapter = requests_mock.get("https://fake-url/endpoint", status_code=502)
+
+    with pytest.raises(requests.HTTPError):
+        requester.request("GET", "/endpoint")
+
+    assert adapter.call_count == requester.retry_policy.max_retries + 1
+
+
+def test_retry_policy_time_budget():
+    policy = RetryPolicy(total_timeout=10, jitter=False)
+
+    assert policy.get_retry_delay("GET", 0, elapsed=1, status_code=503) == 0.5
+    assert policy.get_retry_delay("GET", 0, elapsed=9.9, status_code=503) is None
+    assert (
+        policy.get_retry_delay("GET", 0, 0, status_code=503, retry_after="60") is None
+    )
+    assert policy.get_retry_delay("GET", 0, 0, status_code=404) is None
+    assert RetryPolicy(max_retries=0).get_retry_delay("GET", 0, 0, 503) is None
+
+
+def test_derived_requesters_share_connections(local_server):
+    local_server.routes["/teams"] = lambda request: (200, [])
+
+    requester = Requester(local_server.url, "token")
+    for i in range(5):
+        derived = requester.with_extra_headers({"X-Resource-Group-Id": str(i)})
+        assert derived.session is requester.session
+        derived.request("GET", "/teams")
+
+    # All requests went over the same keep-alive connection
+    assert len(local_server.requests) == 5
+    assert len(local_server.client_ports) == 1
+
+
+def test_pickle(requester):
+    requester.session
+    derived = requester.with_extra_headers({"X-Resource-Group-Id": "1"})
+
+    derived, requester = pickle.loads(pickle.dumps((derived, requester)))
+    assert derived.session_pool is requester.session_pool
+    assert derived.retry_stats is requester.retry_stats
+
+
+def test_concurrent_requests(local_server):
+    def echo(request):
+        time.sleep(0.005)
+        return 200, {
+            "path": request.path,
+            "resourceGroupId": request.headers.get("X-Resource-Group-Id"),
+            "authorization": request.headers.get("Authorization"),
+        }
+
+    for i in range(20):
+        local_server.routes[f"/teams/{i}"] = echo
+
+    # The default pool has room for two of the library's default thread pools
+    requester = Requester(local_server.url, "token")
+    requesters = [
+        requester.with_extra_headers({"X-Resource-Group-Id": str(i)}) for i in range(4)
+    ]
+
+    def do_request(i):
+        resource_group_id = i % 4
+        team_id = i % 20
+        response = requesters[resource_group_id].request("GET", f"/teams/{team_id}")
+        return response == {
+            "path": f"/teams/{team_id}",
+            "resourceGroupId": str(resource_group_id),
+            "authorization": "Bearer token",
+        }
+
+    with ThreadPoolExecutor(max_workers=2 * DEFAULT_MAX_WORKERS) as executor:
+        results = list(executor.map(do_request, range(400)))
+
+    assert all(results)
+    assert local_server.max_in_flight > 1
+    # Connections are reused, no connection per request
+    assert len(local_server.client_ports) <= DEFAULT_POOL_MAXSIZE
+    # Per call headers are not written to the shared headers
+    assert requester.headers == {}
+    assert requesters[0].headers == {"X-Resource-Group-Id": "0"}
+
+
+def test_coalesce_identical_concurrent_gets(local_server):
+    def sporting_events(request):
+        time.sleep(0.2)
+        return 200, [{"sportingEventId": "1"}]
+
+    local_server.routes["/sportingEvents"] = sporting_events
+
+    requester = Requester(local_server.url, "token")
+    team_1 = requester.with_extra_headers({"X-Resource-Group-Id": "1"})
+    team_2 = requester.with_extra_headers({"X-Resource-Group-Id": "2"})
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        results = list(
+            executor.map(
+                lambda i: (team_1 if i < 8 else team_2).request(
+                    "GET", "/sportingEvents"
+                ),
+                range(10),
+            )
+        )
+
+    assert all(result == [{"sportingEventId": "1"}] for result in results)
+    # One request per resource group
+    assert len(local_server.requests) == 2
+    # But every caller gets its own objects
+    assert len({id(result) for result in results}) == 10
+
+
+def test_requests_to_other_hosts_are_not_shared(requests_mock):
+    requests_mock.get("https://host-1/persons", json=[{"personId": "1"}])
+    requests_mock.get("https://host-2/persons", json=[{"personId": "2"}])
+
+    requester_1 = Requester("https://host-1", "token", use_cache=True)
+    requester_2 = Requester("https://host-2", "token", cache=requester_1.cache)
+
+    assert requester_1.request("GET", "/persons") == [{"personId": "1"}]
+    assert requester_2.request("GET", "/persons") == [{"personId": "2"}]
+
+
+def test_coalesce_shares_errors(local_server):
+    def failing(request):
+        time.sleep(0.2)
+        return 403, {"error": "forbidden"}
+
+    local_server.routes["/persons"] = failing
+
+    requester = Requester(local_server.url, "token")
+
+    def do_request(i):
+        with pytest.raises(requests.HTTPError):
+            requester.request("GET", "/persons")
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        list(executor.map(do_request, range(5)))
+
+    assert len(local_server.requests) == 1
@@ -0,0 +1,40 @@
+from pyteamtv.models.sporting_event import SportingEvent
+
+
+def test_get_videos_fetches_only_own_videos(requester, requests_mock):
+    sporting_event = SportingEvent(
+        requester,
+        {
+            "type": "training",
+            "name": "Training",
+            "sportingEventId": "sporting-event-1",
+            "clocks": {},
+            "videoIds": ["video-1", "video-2", "deleted-video"],
+            "scheduledAt": "2022-01-01T10:00:00.000Z",
+        },
+    )
+    collection = requests_mock.get("https://fake-url/videos", json=[])
+    for video_id, output_key in [("video-1", "main"), ("video-2", "switched")]:
+        requests_mock.get(
+            f"https://fake-url/videos/{video_id}",
+            json={
+                "videoId": video_id,
+                "state": "new",
+                "tags": {"output_key": output_key},
+                "parts": [],
+            },
+        )
+    requests_mock.get("https://fake-url/videos/deleted-video", status_code=404)
+
+    # Nothing is fetched until the list is used
+    videos = sporting_event.get_videos()
+    assert not requests_mock.called
+    assert [video.video_id for video in videos] == [
+        "video-1",
+        "video-2",
+    ]
+    assert [
+        video.video_id
+        for video in sporting_event.get_videos_by_tags(output_key="switched")
+    ] == ["video-2"]
+    assert collection.call_count == 0
@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from pyteamtv.store import ObservationStore  # noqa: E402
+
+
+# Recent enough to be checked on every sync
+NOW = datetime.now(timezone.utc).isoformat()
+
+
+def _sporting_event(i: int, scheduled_at: str = NOW, **attributes) -> dict:
+    return {
+        "type": "training",
+        "name": f"Training {i}",
+        "sportingEventId": f"sporting-event-{i}",
+        "clocks": {},
+        "scheduledAt": scheduled_at,
+        **attributes,
+    }
+
+
+def _observation(i: int, code: str = "SHOT") -> dict:
+    return {
+        "observationId": f"obs-{i}",
+        "startTime": 10.0,
+        "triggerTime": 12.0,
+        "endTime": None,
+        "code": code,
+        "attributes": {"distance": i},
+        "description": "",
+        "clockId": "U1",
+    }
+
+
+def _log_url(i: int) -> str:
+    return f"https://fake-url/sportingEvents/sporting-event-{i}/observations/U1"
+
+
+def test_sync(current_team, requests_mock, tmp_path):
+    requests_mock.get(
+        "https://fake-url/sportingEvents",
+        json=[_sporting_event(0), _sporting_event(1)],
+    )
+    log_0 = requests_mock.get(_log_url(0), json=[_observation(0)])
+    log_1 = requests_mock.get(
+        _log_url(1),
+        json=[_observation(1), _observation(2, "PASS")],
+        headers={"ETag": '"v1"'},
+    )
+
+    store = ObservationStore(tmp_path)
+    assert store.watermark is None
+
+    result = store.sync(current_team)
+    assert result.fetched == ["sporting-event-0", "sporting-event-1"]
+    assert store.watermark is not None
+
+    table = store.read()
+    assert table.num_rows == 3
+    assert sorted(table["sporting_event_id"].to_pylist()) == [
+        "sporting-event-0",
+        "sporting-event-1",
+        "sporting-event-1",
+    ]
+    assert table["end_time"].null_count == 3
+
+    # A new store instance picks up the manifest: logs with an ETag are
+    # revalidated, the others downloaded again and compared
+    log_1 = requests_mock.get(_log_url(1), status_code=304)
+    store = ObservationStore(tmp_path)
+    result = store.sync(current_team)
+    assert result.fetched == []
+    assert result.unchanged == ["sporting-event-0", "sporting-event-1"]
+    assert log_0.call_count == 2
+    assert log_1.last_request.headers["If-None-Match"] == '"v1"'
+
+    # A changed log is written again, removed events are pruned
+    requests_mock.get("https://fake-url/sportingEvents", json=[_sporting_event(0)])
+    requests_mock.get(_log_url(0), json=[_observation(0), _observation(3)])
+    result = store.sync(current_team, prune=True)
+    assert result.fetched == ["sporting-event-0"]
+    assert result.removed == ["sporting-event-1"]
+    assert store.sporting_event_ids == ["sporting-event-0"]
+    assert store.read("sporting-event-0").num_rows == 2
+    assert log_1.call_count == 1
+
+
+def test_sync_skips_settled(current_team, requests_mock, tmp_path):
+    settled = "2022-01-01T10:00:00.000Z"
+    requests_mock.get(
+        "https://fake-url/sportingEvents",
+        json=[
+            _sporting_event(0, settled),
+            _sporting_event(1, settled, updatedAt="2022-01-02T10:00:00.000Z"),
+        ],
+    )
+    log_0 = requests_mock.get(_log_url(0), json=[_observation(0)])
+    log_1 = requests_mock.get(_log_url(1), json=[_observation(1)])
+
+    store = ObservationStore(tmp_path)
+    assert store.sync(current_team).fetched == ["sporting-event-0", "sporting-event-1"]
+
+    # Without ETags, logs of sporting events that didn't change since their
+    # last check are not requested again
+    result = store.sync(current_team)
+    assert result.unchanged == ["sporting-event-0", "sporting-event-1"]
+    assert (log_0.call_count, log_1.call_count) == (1, 1)
+
+    # Unless they're updated afterwards, or settled_after is None
+    updated_at = (datetime.now(timezone.utc) + timedelta(minutes=1)).isoformat()
+    requests_mock.get(
+        "https://fake-url/sportingEvents",
+        json=[
+            _sporting_event(0, settled),
+            _sporting_event(1, settled, updatedAt=updated_at),
+        ],
+    )
+    requests_mock.get(_log_url(1), json=[_observation(1), _observation(2)])
+    result = store.sync(current_team)
+    assert result.fetched == ["sporting-event-1"]
+    assert log_0.call_count == 1
+    assert store.read("sporting-event-1").num_rows == 2
+
+    store.sync(current_team, settled_after=None)
+    assert log_0.call_count == 2
+
+
+def test_get_observation_log(current_team, requests_mock, tmp_path):
+    requests_mock.get("https://fake-url/sportingEvents", json=[_sporting_event(0)])
+    requests_mock.get(_log_url(0), json=[_observation(0), _observation(1)])
+
+    store = ObservationStore(tmp_path)
+    store.sync(current_team)
+
+    sporting_event = current_team.get_sporting_events()[0]
+    observation_log = store.get_observation_log(sporting_event)
+    assert [observation.raw_attributes for observation in observation_log] == [
+        _observation(0),
+        _observation(1),
+    ]
+    assert observation_log.sporting_event is sporting_event
+
+    with pytest.raises(KeyError):
+        store.read("sporting-event-2")
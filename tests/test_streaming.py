@@ -0,0 +1,87 @@
+import json
+
+import pytest
+import requests
+
+from pyteamtv.infra.json_stream import iter_json_array
+from pyteamtv.models.observation_log import StreamingObservationLog
+from pyteamtv.models.sporting_event import SportingEvent
+
+
+def _chunks(data: bytes, size: int):
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+def test_iter_json_array(chunk_size):
+    items = [
+        {"name": "Jöhn ⚽", "nested": {"list": [1, 2, {"a": None}]}},
+        12345,
+        -1.5e3,
+        "a, string ] with [ brackets",
+        True,
+        None,
+        [],
+    ]
+    data = json.dumps(items, ensure_ascii=False, indent=2).encode("utf-8")
+
+    assert list(iter_json_array(_chunks(data, chunk_size))) == items
+
+
+def test_iter_json_array_edge_cases():
+    assert list(iter_json_array([b" [ ", b" ] "])) == []
+    assert list(iter_json_array([b"[1", b"23", b"]"])) == [123]
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array([b'{"a": 1}']))
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array([b'[{"a": 1}', b' {"b": 2}]']))
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array([b'[{"a": 1}, {"b"']))
+
+
+def test_streaming_observation_log(requester, requests_mock):
+    sporting_event = SportingEvent(
+        requester,
+        {
+            "type": "training",
+            "name": "Training",
+            "sportingEventId": "sporting-event-1",
+            "clocks": {},
+            "scheduledAt": "2022-01-01T10:00:00.000Z",
+        },
+    )
+    observations = [
+        {
+            "observationId": f"obs-{i}",
+            "startTime": float(i),
+            "triggerTime": float(i),
+            "endTime": float(i),
+            "code": "SHOT",
+            "attributes": {},
+            "description": "",
+            "clockId": "U1",
+        }
+        for i in range(100)
+    ]
+    requests_mock.get(
+        "https://fake-url/sportingEvents/sporting-event-1/observations/U1",
+        json=observations,
+    )
+
+    observation_log = sporting_event.get_observation_log(stream=True)
+
+    assert isinstance(observation_log, StreamingObservationLog)
+    assert [observation.observation_id for observation in observation_log] == [
+        f"obs-{i}" for i in range(100)
+    ]
+    assert observation_log.get_mapping_stats() == dict(success=100, failed=0)
+
+
+def test_streaming_http_error(requester, requests_mock):
+    requests_mock.get("https://fake-url/videos", status_code=404, text="Not found")
+
+    with pytest.raises(requests.HTTPError, match="Not found"):
+        list(requester.request_stream("GET", "/videos"))
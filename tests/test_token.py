@@ -0,0 +1,60 @@
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from pyteamtv.api import token as token_module
+
+
+@pytest.fixture
+def key_pair():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_key = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return private_key, public_key
+
+
+@pytest.fixture
+def app_token(key_pair):
+    private_key, _ = key_pair
+    return jwt.encode(
+        {"sub": "user-1", "aud": "app:app-1", "exp": int(time.time()) + 60},
+        private_key,
+        algorithm="RS256",
+    )
+
+
+@pytest.fixture(autouse=True)
+def clean_key_cache():
+    token_module.set_public_key(None)
+    yield
+    token_module.set_public_key(None)
+
+
+def test_decode_with_injected_key(key_pair, app_token, requests_mock):
+    _, public_key = key_pair
+    token_module.set_public_key(public_key)
+
+    assert token_module.decode(app_token, "app-1")["sub"] == "user-1"
+    assert not requests_mock.called
+
+
+def test_public_key_is_fetched_lazily_and_cached(key_pair, app_token, requests_mock):
+    _, public_key = key_pair
+    adapter = requests_mock.get(token_module.PUBLIC_KEY_URL, content=public_key)
+
+    # Decoding without verification never needs the key
+    assert token_module.decode(app_token, verify=False)["sub"] == "user-1"
+    assert adapter.call_count == 0
+
+    token_module.decode(app_token, "app-1")
+    token_module.decode(app_token, "app-1")
+    assert adapter.call_count == 1
+
+    # The key is only cached in-process
+    token_module.set_public_key(None)
+    token_module.decode(app_token, "app-1")
+    assert adapter.call_count == 2
@@ -108,23 +108,21 @@ class TestVideoUpload:
         upload_offset = file_size - 100  # Fake the upload offset
 
         requests_mock.get(
-            f"https://fake-url/videos",
-            json=[
-                {
-                    "videoId": video_id,
-                    "state": "new",
-                    "tags": tags,
-                    "parts": [
-                        {
-                            "fileSize": file_size
-                            - 1,  # Return an incorrect filesize. The resume code MUST check
-                            # if the local and remote filesizes match.
-                            "state": "new",
-                            "tusUploadUrl": "https://upload-url/random-url",
-                        }
-                    ],
-                }
-            ],
+            f"https://fake-url/videos/{video_id}",
+            json={
+                "videoId": video_id,
+                "state": "new",
+                "tags": tags,
+                "parts": [
+                    {
+                        "fileSize": file_size
+                        - 1,  # Return an incorrect filesize. The resume code MUST check
+                        # if the local and remote filesizes match.
+                        "state": "new",
+                        "tusUploadUrl": "https://upload-url/random-url",
+                    }
+                ],
+            },
         )
         requests_mock.head(
             "https://upload-url/random-url",
@@ -153,6 +151,17 @@ class TestVideoUpload:
                 resume_if_exists=True,
             )
 
+        with pytest.raises(
+            InputError,
+            match=r"File size of '.*test\.mp4' doesn't match existing video",
+        ):
+            sporting_event.upload_video(
+                test_mp4,
+                description="Test Training",
+                resume_if_exists=True,
+                tags=tags,
+            )
+
         requests_mock.get(
             f"https://fake-url/videos/{video_id}",
             json={
@@ -168,35 +177,6 @@ class TestVideoUpload:
                 ],
             },
         )
-
-        with pytest.raises(
-            InputError,
-            match=r"File size of '.*test\.mp4' doesn't match existing video",
-        ):
-            sporting_event.upload_video(
-                test_mp4,
-                description="Test Training",
-                resume_if_exists=True,
-                tags=tags,
-            )
-
-        requests_mock.get(
-            f"https://fake-url/videos",
-            json=[
-                {
-                    "videoId": video_id,
-                    "state": "new",
-                    "tags": tags,
-                    "parts": [
-                        {
-                            "fileSize": file_size,
-                            "state": "new",
-                            "tusUploadUrl": "https://upload-url/random-url",
-                        }
-                    ],
-                }
-            ],
-        )
         sporting_event.upload_video(
             test_mp4,
             description="Test Training",
@@ -233,21 +213,19 @@ class TestVideoUpload:
         file_size = os.path.getsize(test_mp4)
 
         requests_mock.get(
-            f"https://fake-url/videos",
-            json=[
-                {
-                    "videoId": video_id,
-                    "state": "new",
-                    "tags": tags,
-                    "parts": [
-                        {
-                            "fileSize": file_size,
-                            "state": "upload-success",
-                            "tusUploadUrl": "https://upload-url/random-url",
-                        }
-                    ],
-                }
-            ],
+            f"https://fake-url/videos/{video_id}",
+            json={
+                "videoId": video_id,
+                "state": "new",
+                "tags": tags,
+                "parts": [
+                    {
+                        "fileSize": file_size,
+                        "state": "upload-success",
+                        "tusUploadUrl": "https://upload-url/random-url",
+                    }
+                ],
+            },
         )
 
         video = sporting_event.upload_video(
@@ -275,7 +253,7 @@ class TestVideoUpload:
                 "sportingEventId": sporting_event_id,
                 "clocks": {},
                 # This isn't correct but since the SportingEvent is cached in pyteamtv we need to pass
-                # the video id already. Otherwise it will be filtered out in sportingEvent.get_videos()
+                # the video id already. Otherwise it isn't fetched by sportingEvent.get_videos()
                 "videoIds": [video_id],
                 "scheduledAt": "2022-01-01T10:00:00.000Z",
             },
@@ -291,49 +269,26 @@ class TestVideoUpload:
         )
         file_size = os.path.getsize(test_mp4)
         requests_mock.get(
-            f"https://fake-url/videos",
+            f"https://fake-url/videos/{video_id}",
             [
                 # Before we create the livestream
-                {"json": []},
-                # When livestream is created but no part is added yet
-                {
-                    "json": [
-                        {
-                            "videoId": video_id,
-                            "state": "new",
-                            "tags": tags,
-                            "parts": [],
-                        }
-                    ]
-                },
-                # When the video part is added
+                {"status_code": 404},
+                # When only the livestream is created
                 {
-                    "json": [
-                        {
-                            "videoId": video_id,
-                            "state": "new",
-                            "tags": tags,
-                            "parts": [
-                                {
-                                    "fileSize": file_size,
-                                    "state": "new",
-                                    "tusUploadUrl": "https://upload-url/random-url",
-                                }
-                            ],
-                        }
-                    ]
+                    "json": {
+                        "videoId": video_id,
+                        "state": "new",
+                        "tags": tags,
+                        "livestream": {"url": "https://some-url/1231232/main.m3u8"},
+                        "parts": [],
+                    }
                 },
-            ],
-        )
-
-        requests_mock.get(
-            f"https://fake-url/videos/{video_id}",
-            [
-                # When only the livestream is created
+                # When looking up the video to resume
                 {
                     "json": {
                         "videoId": video_id,
                         "state": "new",
+                        "tags": tags,
                         "livestream": {"url": "https://some-url/1231232/main.m3u8"},
                         "parts": [],
                     }
@@ -343,6 +298,7 @@ class TestVideoUpload:
                     "json": {
                         "videoId": video_id,
                         "state": "new",
+                        "tags": tags,
                         "livestream": {"url": "https://some-url/1231232/main.m3u8"},
                         "parts": [
                             {